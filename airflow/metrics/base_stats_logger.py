@@ -17,7 +17,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager
 
 from airflow.metrics.protocols import Timer
 from airflow.typing_compat import Protocol
@@ -80,6 +81,11 @@ class StatsLogger(Protocol):
         """Timer metric that can be cancelled."""
         raise NotImplementedError()
 
+    @classmethod
+    def pipeline(cls) -> ContextManager[None]:
+        """Batch the stats emitted by the current thread, if the backend supports it."""
+        raise NotImplementedError()
+
 
 class NoStatsLogger:
     """If no StatsLogger is configured, NoStatsLogger is used as a fallback."""
@@ -112,3 +118,8 @@ class NoStatsLogger:
     def timer(cls, *args, **kwargs) -> TimerProtocol:
         """Timer metric that can be cancelled."""
         return Timer()
+
+    @classmethod
+    def pipeline(cls) -> ContextManager[None]:
+        """Batch the stats emitted by the current thread, if the backend supports it."""
+        return nullcontext()
@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import datetime
 import logging
-from typing import TYPE_CHECKING
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import TYPE_CHECKING, ContextManager
 
 from airflow.configuration import conf
 from airflow.metrics.protocols import Timer
@@ -31,6 +33,8 @@ from airflow.metrics.validators import (
 )
 
 if TYPE_CHECKING:
+    from typing import Iterable
+
     from datadog import DogStatsd
 
     from airflow.metrics.protocols import DeltaType, TimerProtocol
@@ -55,6 +59,24 @@ class SafeDogStatsdLogger:
         self.metrics_validator = metrics_validator
         self.metrics_tags = metrics_tags
         self.metric_tags_validator = metric_tags_validator
+        self._format_tags = lru_cache(maxsize=2048)(self._build_tags_list)
+
+    def _build_tags_list(self, tags: Iterable[tuple[str, str]]) -> list[str]:
+        return [f"{key}:{value}" for key, value in tags if self.metric_tags_validator.test(key)]
+
+    def _get_tags_list(self, tags: dict[str, str] | None) -> list[str]:
+        """
+        Return the DogStatsd tags for the given tags dict.
+
+        The same tags are sent with many stats, so the formatted lists are cached. They are shared
+        between calls and must not be modified.
+        """
+        if not (self.metrics_tags and tags):
+            return []
+        try:
+            return self._format_tags(tuple(tags.items()))
+        except TypeError:  # unhashable tag values
+            return self._build_tags_list(tags.items())
 
     @validate_stat
     def incr(
@@ -66,12 +88,7 @@ class SafeDogStatsdLogger:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Increment stat."""
-        if self.metrics_tags and isinstance(tags, dict):
-            tags_list = [
-                f"{key}:{value}" for key, value in tags.items() if self.metric_tags_validator.test(key)
-            ]
-        else:
-            tags_list = []
+        tags_list = self._get_tags_list(tags)
         if self.metrics_validator.test(stat):
             return self.dogstatsd.increment(metric=stat, value=count, tags=tags_list, sample_rate=rate)
         return None
@@ -86,12 +103,7 @@ class SafeDogStatsdLogger:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Decrement stat."""
-        if self.metrics_tags and isinstance(tags, dict):
-            tags_list = [
-                f"{key}:{value}" for key, value in tags.items() if self.metric_tags_validator.test(key)
-            ]
-        else:
-            tags_list = []
+        tags_list = self._get_tags_list(tags)
         if self.metrics_validator.test(stat):
             return self.dogstatsd.decrement(metric=stat, value=count, tags=tags_list, sample_rate=rate)
         return None
@@ -107,12 +119,7 @@ class SafeDogStatsdLogger:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Gauge stat."""
-        if self.metrics_tags and isinstance(tags, dict):
-            tags_list = [
-                f"{key}:{value}" for key, value in tags.items() if self.metric_tags_validator.test(key)
-            ]
-        else:
-            tags_list = []
+        tags_list = self._get_tags_list(tags)
         if self.metrics_validator.test(stat):
             return self.dogstatsd.gauge(metric=stat, value=value, tags=tags_list, sample_rate=rate)
         return None
@@ -126,12 +133,7 @@ class SafeDogStatsdLogger:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Stats timing."""
-        if self.metrics_tags and isinstance(tags, dict):
-            tags_list = [
-                f"{key}:{value}" for key, value in tags.items() if self.metric_tags_validator.test(key)
-            ]
-        else:
-            tags_list = []
+        tags_list = self._get_tags_list(tags)
         if self.metrics_validator.test(stat):
             if isinstance(dt, datetime.timedelta):
                 dt = dt.total_seconds()
@@ -146,16 +148,15 @@ class SafeDogStatsdLogger:
         **kwargs,
     ) -> TimerProtocol:
         """Timer metric that can be cancelled."""
-        if self.metrics_tags and isinstance(tags, dict):
-            tags_list = [
-                f"{key}:{value}" for key, value in tags.items() if self.metric_tags_validator.test(key)
-            ]
-        else:
-            tags_list = []
+        tags_list = self._get_tags_list(tags)
         if stat and self.metrics_validator.test(stat):
             return Timer(self.dogstatsd.timed(stat, tags=tags_list, **kwargs))
         return Timer()
 
+    def pipeline(self) -> ContextManager[None]:
+        """DogStatsd buffers stats on its own, so there is nothing to batch here."""
+        return nullcontext()
+
 
 def get_dogstatsd_logger(cls) -> SafeDogStatsdLogger:
     """Get DataDog StatsD logger."""
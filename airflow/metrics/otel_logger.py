@@ -20,8 +20,9 @@ import datetime
 import logging
 import random
 import warnings
+from contextlib import nullcontext
 from functools import partial
-from typing import TYPE_CHECKING, Callable, Iterable, Union
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterable, Union
 
 from opentelemetry import metrics
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
@@ -149,6 +150,8 @@ class _OtelTimer(Timer):
     :param tags: Tags to append to the timer.
     """
 
+    __slots__ = ("name", "otel_logger", "tags")
+
     def __init__(self, otel_logger: SafeOtelLogger, name: str | None, tags: Attributes):
         super().__init__()
         self.otel_logger = otel_logger
@@ -287,6 +290,10 @@ class SafeOtelLogger:
         """Timer context manager returns the duration and can be cancelled."""
         return _OtelTimer(self, stat, tags)
 
+    def pipeline(self) -> ContextManager[None]:
+        """OTel exports metrics periodically in batches, so there is nothing to batch here."""
+        return nullcontext()
+
 
 class MetricsMap:
     """Stores Otel Instruments."""
@@ -29,6 +29,8 @@ DeltaType = Union[int, float, datetime.timedelta]
 class TimerProtocol(Protocol):
     """Type protocol for StatsLogger.timer."""
 
+    __slots__ = ()
+
     def __enter__(self) -> Timer: ...
 
     def __exit__(self, exc_type, exc_value, traceback) -> None: ...
@@ -94,11 +96,16 @@ class Timer(TimerProtocol):
     # pystatsd and dogstatsd both have a timer class, but present different API
     # so we can't use this as a mixin on those, instead this class contains the "real" timer
 
-    _start_time: float | None
+    # A timer is created for every timed block, so skip the per-instance __dict__.
+    __slots__ = ("_start_time", "duration", "real_timer")
+
+    _start_time: int | None
     duration: float | None
 
     def __init__(self, real_timer: Timer | None = None) -> None:
         self.real_timer = real_timer
+        self._start_time = None
+        self.duration = None
 
     def __enter__(self) -> Timer:
         return self.start()
@@ -110,12 +117,12 @@ class Timer(TimerProtocol):
         """Start the timer."""
         if self.real_timer:
             self.real_timer.start()
-        self._start_time = time.perf_counter()
+        self._start_time = time.perf_counter_ns()
         return self
 
     def stop(self, send: bool = True) -> None:
         """Stop the timer, and optionally send it to stats backend."""
         if self._start_time is not None:
-            self.duration = time.perf_counter() - self._start_time
+            self.duration = (time.perf_counter_ns() - self._start_time) / 1e9
         if send and self.real_timer:
             self.real_timer.stop()
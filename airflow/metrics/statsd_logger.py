@@ -18,21 +18,24 @@
 from __future__ import annotations
 
 import logging
+import threading
+from contextlib import contextmanager
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, TypeVar, cast
+from typing import TYPE_CHECKING, Callable, Generator, TypeVar, cast
 
 from airflow.configuration import conf
-from airflow.exceptions import AirflowConfigException
+from airflow.exceptions import AirflowConfigException, InvalidStatsNameException
 from airflow.metrics.protocols import Timer
 from airflow.metrics.validators import (
     AllowListValidator,
     BlockListValidator,
+    get_current_handler_stat_name_func,
     get_validator,
-    validate_stat,
 )
 
 if TYPE_CHECKING:
     from statsd import StatsClient
+    from statsd.client.base import StatsClientBase
 
     from airflow.metrics.protocols import DeltaType, TimerProtocol
     from airflow.metrics.validators import (
@@ -45,20 +48,32 @@ log = logging.getLogger(__name__)
 
 
 def prepare_stat_with_tags(fn: T) -> T:
-    """Add tags to stat with influxdb standard format if influxdb_tags_enabled is True."""
+    """
+    Add tags to stat with influxdb standard format if influxdb_tags_enabled is True and validate the stat.
+
+    Both steps are done in a single wrapper as they run for every metric. If the resulting stat name is
+    invalid, it is logged and the stat is not emitted.
+    """
 
     @wraps(fn)
     def wrapper(
         self, stat: str | None = None, *args, tags: dict[str, str] | None = None, **kwargs
-    ) -> Callable[[str], str]:
-        if self.influxdb_tags_enabled:
-            if stat is not None and tags is not None:
+    ) -> Callable[[str], str] | None:
+        if stat is not None:
+            if self.influxdb_tags_enabled and tags:
+                tag_parts = [stat]
                 for k, v in tags.items():
                     if self.metric_tags_validator.test(k):
-                        if all(c not in [",", "="] for c in v + k):
-                            stat += f",{k}={v}"
+                        if "," not in k + v and "=" not in k + v:
+                            tag_parts.append(f"{k}={v}")
                         else:
                             log.error("Dropping invalid tag: %s=%s.", k, v)
+                stat = ",".join(tag_parts)
+            try:
+                stat = get_current_handler_stat_name_func()(stat)
+            except InvalidStatsNameException:
+                log.exception("Invalid stat name: %s.", stat)
+                return None
         return fn(self, stat, *args, tags=tags, **kwargs)
 
     return cast(T, wrapper)
@@ -78,9 +93,33 @@ class SafeStatsdLogger:
         self.metrics_validator = metrics_validator
         self.influxdb_tags_enabled = influxdb_tags_enabled
         self.metric_tags_validator = metric_tags_validator
+        self._local = threading.local()
+
+    @property
+    def _client(self) -> StatsClientBase:
+        """Return the pipeline opened by the current thread, or the StatsD client if there is none."""
+        pipeline = getattr(self._local, "pipeline", None)
+        return self.statsd if pipeline is None else pipeline
+
+    @contextmanager
+    def pipeline(self) -> Generator[None, None, None]:
+        """
+        Buffer the stats emitted by the current thread and send them together on exit.
+
+        The StatsD pipeline packs the buffered stats into as few UDP packets as possible,
+        instead of sending one packet per stat. Timers are not buffered.
+        """
+        if getattr(self._local, "pipeline", None) is not None:
+            yield
+            return
+        with self.statsd.pipeline() as pipe:
+            self._local.pipeline = pipe
+            try:
+                yield
+            finally:
+                self._local.pipeline = None
 
     @prepare_stat_with_tags
-    @validate_stat
     def incr(
         self,
         stat: str,
@@ -91,11 +130,10 @@ class SafeStatsdLogger:
     ) -> None:
         """Increment stat."""
         if self.metrics_validator.test(stat):
-            return self.statsd.incr(stat, count, rate)
+            return self._client.incr(stat, count, rate)
         return None
 
     @prepare_stat_with_tags
-    @validate_stat
     def decr(
         self,
         stat: str,
@@ -106,11 +144,10 @@ class SafeStatsdLogger:
     ) -> None:
         """Decrement stat."""
         if self.metrics_validator.test(stat):
-            return self.statsd.decr(stat, count, rate)
+            return self._client.decr(stat, count, rate)
         return None
 
     @prepare_stat_with_tags
-    @validate_stat
     def gauge(
         self,
         stat: str,
@@ -122,11 +159,10 @@ class SafeStatsdLogger:
     ) -> None:
         """Gauge stat."""
         if self.metrics_validator.test(stat):
-            return self.statsd.gauge(stat, value, rate, delta)
+            return self._client.gauge(stat, value, rate, delta)
         return None
 
     @prepare_stat_with_tags
-    @validate_stat
     def timing(
         self,
         stat: str,
@@ -136,11 +172,10 @@ class SafeStatsdLogger:
     ) -> None:
         """Stats timing."""
         if self.metrics_validator.test(stat):
-            return self.statsd.timing(stat, dt)
+            return self._client.timing(stat, dt)
         return None
 
     @prepare_stat_with_tags
-    @validate_stat
     def timer(
         self,
         stat: str | None = None,
@@ -23,11 +23,12 @@ import abc
 import logging
 import string
 import warnings
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from typing import Callable, Iterable, Pattern, cast
 
 import re2
 
+from airflow.compat.functools import cache
 from airflow.configuration import conf
 from airflow.exceptions import InvalidStatsNameException, RemovedInAirflow3Warning
 
@@ -45,6 +46,7 @@ class MetricNameLengthExemptionWarning(Warning):
 # Only characters in the character set are considered valid
 # for the stat_name if stat_name_default_handler is used.
 ALLOWED_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_.-")
+ALLOWED_INFLUXDB_CHARACTERS = ALLOWED_CHARACTERS | {",", "="}
 
 # The following set contains existing metrics whose names are too long for
 # OpenTelemetry and should be deprecated over time. This is implemented to
@@ -216,7 +218,12 @@ def stat_name_default_handler(
         raise InvalidStatsNameException(
             f"The stat_name ({stat_name}) has to be less than {max_length} characters."
         )
-    if any(c not in allowed_chars for c in stat_name):
+    if isinstance(allowed_chars, frozenset):
+        # Deleting every allowed character in C leaves something behind only for an invalid name.
+        has_invalid_chars = bool(stat_name.translate(_deletion_table(allowed_chars)))
+    else:
+        has_invalid_chars = any(c not in allowed_chars for c in stat_name)
+    if has_invalid_chars:
         raise InvalidStatsNameException(
             f"The stat name ({stat_name}) has to be composed of ASCII "
             f"alphabets, numbers, or the underscore, dot, or dash characters."
@@ -224,17 +231,42 @@ def stat_name_default_handler(
     return stat_name
 
 
+@cache
+def _deletion_table(allowed_chars: frozenset[str]) -> dict[int, None]:
+    return str.maketrans("", "", "".join(allowed_chars))
+
+
+@cache
 def get_current_handler_stat_name_func() -> Callable[[str], str]:
-    """Get Stat Name Handler from airflow.cfg."""
+    """
+    Get Stat Name Handler from airflow.cfg.
+
+    The handler is resolved once and reused for every metric; call
+    ``get_current_handler_stat_name_func.cache_clear()`` after changing the configuration.
+    """
     handler = conf.getimport("metrics", "stat_name_handler")
     if handler is None:
         if conf.get("metrics", "statsd_influxdb_enabled", fallback=False):
-            handler = partial(stat_name_default_handler, allowed_chars={*ALLOWED_CHARACTERS, ",", "="})
+            handler = partial(stat_name_default_handler, allowed_chars=ALLOWED_INFLUXDB_CHARACTERS)
         else:
             handler = stat_name_default_handler
+        # The built-in handlers are pure and the same names are emitted over and over again, so the
+        # names that passed validation are remembered. Invalid names raise and are not cached.
+        handler = _cache_valid_stat_names(handler)
     return handler
 
 
+def _cache_valid_stat_names(handler: Callable[[str], str]) -> Callable[[str], str]:
+    cached_handler = lru_cache(maxsize=4096)(handler)
+
+    def wrapper(stat_name: str) -> str:
+        if isinstance(stat_name, str):
+            return cached_handler(stat_name)
+        return handler(stat_name)
+
+    return wrapper
+
+
 class ListValidator(metaclass=abc.ABCMeta):
     """
     ListValidator metaclass that can be implemented as a AllowListValidator or BlockListValidator.
@@ -256,6 +288,11 @@ class ListValidator(metaclass=abc.ABCMeta):
         """Test if name is allowed."""
         raise NotImplementedError
 
+    def _has_prefix_match(self, name: str) -> bool:
+        prefixes = self.validate_list or ()
+        # Stat names are nearly always lowercase already, so try them as they are before normalizing.
+        return name.startswith(prefixes) or name.strip().lower().startswith(prefixes)
+
     def _has_pattern_match(self, name: str) -> bool:
         for entry in self.validate_list or ():
             if re2.findall(entry, name.strip().lower()):
@@ -268,7 +305,7 @@ class AllowListValidator(ListValidator):
 
     def test(self, name: str) -> bool:
         if self.validate_list is not None:
-            return name.strip().lower().startswith(self.validate_list)
+            return self._has_prefix_match(name)
         else:
             return True  # default is all metrics are allowed
 
@@ -288,7 +325,7 @@ class BlockListValidator(ListValidator):
 
     def test(self, name: str) -> bool:
         if self.validate_list is not None:
-            return not name.strip().lower().startswith(self.validate_list)
+            return not self._has_prefix_match(name)
         else:
             return True  # default is all metrics are allowed
 
@@ -19,13 +19,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
-
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, Sequence, TypeVar
+
+import grpc
 from deprecated import deprecated
 from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import AlreadyExists
+from google.api_core.future.polling import DEFAULT_POLLING
 from google.api_core.gapic_v1.method import DEFAULT, _MethodDefault
-from google.cloud.devtools.cloudbuild_v1 import CloudBuildAsyncClient, CloudBuildClient, GetBuildRequest
+from google.cloud.devtools.cloudbuild_v1 import (
+    Build,
+    BuildTrigger,
+    CloudBuildAsyncClient,
+    CloudBuildClient,
+    GetBuildRequest,
+    RepoSource,
+)
+from google.cloud.devtools.cloudbuild_v1.services.cloud_build.transports import CloudBuildGrpcTransport
 
 from airflow.exceptions import AirflowException, AirflowProviderDeprecationWarning
 from airflow.providers.google.common.consts import CLIENT_INFO
@@ -33,18 +51,75 @@ from airflow.providers.google.common.hooks.base_google import PROVIDE_PROJECT_ID
 
 if TYPE_CHECKING:
     from google.api_core.operation import Operation
+    from google.api_core.operation_async import AsyncOperation
     from google.api_core.retry import Retry
     from google.api_core.retry_async import AsyncRetry
-    from google.cloud.devtools.cloudbuild_v1.types import Build, BuildTrigger, RepoSource
 
-# Time to sleep between active checks of the operation results
-TIME_TO_SLEEP_IN_SECONDS = 5
+MessageT = TypeVar("MessageT", Build, BuildTrigger, RepoSource)
+
+# Polling policy of long-running operations: check every second at first, then back off up to 10 seconds.
+_POLLING_INITIAL_DELAY = 1.0
+_POLLING_MAXIMUM_DELAY = 10.0
+_POLLING_MULTIPLIER = 2.0
+OPERATION_POLLING = DEFAULT_POLLING.with_delay(
+    initial=_POLLING_INITIAL_DELAY, maximum=_POLLING_MAXIMUM_DELAY, multiplier=_POLLING_MULTIPLIER
+)
+
+# Options of the gRPC channel of the shared client. Message sizes are unlimited, as in the channel the
+# generated transport creates, keepalive pings prevent idle connections from being silently dropped between
+# tasks, and requests are compressed with gzip.
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.default_compression_algorithm", grpc.Compression.Gzip),
+]
+
+# Clients shared by all hook instances of the process, so that consecutive tasks reuse the already
+# established gRPC channel. Keyed by connection id, a digest of the connection extras, impersonation chain
+# and location, so that editing or rotating the connection creates a new client with new credentials.
+# Only the most recently used clients are kept. Evicted clients are not closed, as other hooks may still
+# use them; their channel is closed when the last reference goes away.
+_CLIENT_CACHE_MAX_SIZE = 16
+_CLIENT_CACHE: OrderedDict[tuple[str, str, tuple[str, ...], str], CloudBuildClient] = OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _reset_client_cache_after_fork() -> None:
+    """Drop the clients inherited from the parent process, whose gRPC channels can't be used after fork."""
+    global _CLIENT_CACHE_LOCK
+    _CLIENT_CACHE_LOCK = threading.Lock()
+    _CLIENT_CACHE.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_cache_after_fork)
+
+
+def _get_credentials_key(hook: GoogleBaseHook) -> tuple[str, str, tuple[str, ...]]:
+    """Identify the credentials of the hook by its connection id, connection extras and impersonation."""
+    # The extras are read when the hook is created, so a digest of them changes as soon as the connection
+    # is edited. Only the digest is kept, to not hold on to key material.
+    extras_digest = hashlib.sha256(json.dumps(hook.extras, sort_keys=True, default=str).encode()).hexdigest()
+    if isinstance(hook.impersonation_chain, str):
+        return hook.gcp_conn_id, extras_digest, (hook.impersonation_chain,)
+    return hook.gcp_conn_id, extras_digest, tuple(hook.impersonation_chain or ())
+
+
+def _to_message(message_cls: type[MessageT], value: dict | MessageT) -> MessageT:
+    """Convert a dict to the given proto-plus message; messages are returned unchanged."""
+    return message_cls(value) if isinstance(value, dict) else value
 
 
 class CloudBuildHook(GoogleBaseHook):
     """
     Hook for the Google Cloud Build Service.
 
+    Builds, triggers and sources can be given either as dicts or as protobuf messages. Dicts are
+    converted to messages before each request, so passing messages directly is the faster path.
+
     :param gcp_conn_id: The connection ID to use when fetching connection info.
     :param impersonation_chain: Optional service account to impersonate using short-term
         credentials, or chained list of accounts required to get the access_token
@@ -70,24 +145,30 @@ class CloudBuildHook(GoogleBaseHook):
         super().__init__(gcp_conn_id=gcp_conn_id, impersonation_chain=impersonation_chain)
         self._client: dict[str, CloudBuildClient] = {}
 
-    def _get_build_id_from_operation(self, operation: Operation) -> str:
+    @staticmethod
+    def _get_build_id_from_operation(operation: Operation | AsyncOperation) -> str:
         """
         Retrieve Cloud Build ID from Operation Object.
 
-        :param operation: The proto to append resource_label airflow
-            version to
+        The ID is read directly from the typed ``BuildOperationMetadata`` of the operation,
+        without converting the whole message to a dict.
+
+        :param operation: The long-running operation returned by the Cloud Build API.
 
         :return: Cloud Build ID
         """
         try:
-            return operation.metadata.build.id
-        except Exception:
+            build_id = operation.metadata.build.id
+        except AttributeError:
+            build_id = None
+        if not build_id:
             raise AirflowException("Could not retrieve Build ID from Operation.")
+        return build_id
 
     def wait_for_operation(self, operation: Operation, timeout: float | None = None):
         """Wait for long-lasting operation to complete."""
         try:
-            return operation.result(timeout=timeout)
+            return operation.result(timeout=timeout, polling=OPERATION_POLLING)
         except Exception:
             error = operation.exception(timeout=timeout)
             raise AirflowException(error)
@@ -101,16 +182,38 @@ class CloudBuildHook(GoogleBaseHook):
         :return: Google Cloud Build client object.
         """
         if location not in self._client:
-            client_options = None
-            if location != "global":
-                client_options = ClientOptions(api_endpoint=f"{location}-cloudbuild.googleapis.com:443")
-            self._client[location] = CloudBuildClient(
-                credentials=self.get_credentials(),
-                client_info=CLIENT_INFO,
-                client_options=client_options,
-            )
+            self._client[location] = self._get_cached_client(location)
         return self._client[location]
 
+    def _get_cached_client(self, location: str) -> CloudBuildClient:
+        """Return the process-wide client for this connection and location, creating it if needed."""
+        key = (*_get_credentials_key(self), location)
+        with _CLIENT_CACHE_LOCK:
+            if key in _CLIENT_CACHE:
+                _CLIENT_CACHE.move_to_end(key)
+                return _CLIENT_CACHE[key]
+
+        # Deriving credentials may read key files or exchange tokens, so it is done outside of the lock.
+        credentials = self.get_credentials()
+        host = "cloudbuild.googleapis.com"
+        if location != "global":
+            host = f"{location}-cloudbuild.googleapis.com"
+        channel = CloudBuildGrpcTransport.create_channel(
+            f"{host}:443",
+            credentials=credentials,
+            options=GRPC_CHANNEL_OPTIONS,
+        )
+        client = CloudBuildClient(
+            transport=CloudBuildGrpcTransport(host=host, channel=channel, client_info=CLIENT_INFO),
+        )
+        with _CLIENT_CACHE_LOCK:
+            # Another hook may have created a client for the same key in the meantime, keep only one.
+            client = _CLIENT_CACHE.setdefault(key, client)
+            _CLIENT_CACHE.move_to_end(key)
+            if len(_CLIENT_CACHE) > _CLIENT_CACHE_MAX_SIZE:
+                _CLIENT_CACHE.popitem(last=False)
+        return client
+
     @GoogleBaseHook.fallback_to_default_project_id
     def cancel_build(
         self,
@@ -179,7 +282,7 @@ class CloudBuildHook(GoogleBaseHook):
         self.log.info("Start creating build...")
 
         operation = client.create_build(
-            request={"parent": parent, "project_id": project_id, "build": build},
+            request={"parent": parent, "project_id": project_id, "build": _to_message(Build, build)},
             retry=retry,
             timeout=timeout,
             metadata=metadata,
@@ -223,7 +326,7 @@ class CloudBuildHook(GoogleBaseHook):
         self.log.info("Start creating build...")
 
         operation = client.create_build(
-            request={"project_id": project_id, "build": build},
+            request={"project_id": project_id, "build": _to_message(Build, build)},
             retry=retry,
             timeout=timeout,
             metadata=metadata,
@@ -234,11 +337,73 @@ class CloudBuildHook(GoogleBaseHook):
         if not wait:
             return self.get_build(id_=id_, project_id=project_id)
 
-        operation.result()
+        build = operation.result(polling=OPERATION_POLLING)
 
         self.log.info("Build has been created: %s.", id_)
 
-        return self.get_build(id_=id_, project_id=project_id)
+        return build
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    def create_builds(
+        self,
+        builds: Sequence[dict | Build],
+        project_id: str = PROVIDE_PROJECT_ID,
+        wait: bool = True,
+        retry: Retry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+        location: str = "global",
+        max_workers: int | None = None,
+    ) -> list[Build]:
+        """
+        Start several builds concurrently over a single client.
+
+        The requests are multiplexed over the gRPC channel of the shared client, so the connection and
+        authentication cost is paid once for the whole batch.
+
+        :param builds: The build resources to create. If a dict is provided, it must be of the same form
+            as the protobuf message `google.cloud.devtools.cloudbuild_v1.types.Build`
+        :param project_id: Optional, Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the GCP connection is used.
+        :param wait: Optional, wait for all operations to finish.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        :param location: The location of the project.
+        :param max_workers: Optional, maximum number of builds submitted or awaited at the same time.
+
+        :return: The builds, in the same order as ``builds``. If ``wait`` is False, these are the builds
+            as they were queued.
+        :raises: The error of the first failed submission. The other builds are still submitted and are
+            not cancelled, so they keep running.
+        """
+        if not builds:
+            return []
+
+        # Create the client up front, so that the worker threads do not race to build it.
+        self.get_conn(location=location)
+
+        def _create(build: dict | Build) -> Operation:
+            operation, _ = self.create_build_without_waiting_for_result(
+                build=build,
+                project_id=project_id,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                location=location,
+            )
+            return operation
+
+        def _wait(operation: Operation) -> Build:
+            return self.wait_for_operation(operation, timeout)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            operations = list(executor.map(_create, (_to_message(Build, build) for build in builds)))
+            if not wait:
+                return [operation.metadata.build for operation in operations]
+            return list(executor.map(_wait, operations))
 
     @GoogleBaseHook.fallback_to_default_project_id
     def create_build_trigger(
@@ -270,7 +435,7 @@ class CloudBuildHook(GoogleBaseHook):
 
         try:
             trigger = client.create_build_trigger(
-                request={"project_id": project_id, "trigger": trigger},
+                request={"project_id": project_id, "trigger": _to_message(BuildTrigger, trigger)},
                 retry=retry,
                 timeout=timeout,
                 metadata=metadata,
@@ -343,7 +508,7 @@ class CloudBuildHook(GoogleBaseHook):
         """
         client = self.get_conn(location=location)
 
-        self.log.info("Start retrieving build: %s.", id_)
+        self.log.debug("Start retrieving build: %s.", id_)
 
         build = client.get_build(
             request={"project_id": project_id, "id": id_},
@@ -352,7 +517,7 @@ class CloudBuildHook(GoogleBaseHook):
             metadata=metadata,
         )
 
-        self.log.info("Build has been retrieved: %s.", id_)
+        self.log.debug("Build has been retrieved: %s.", id_)
 
         return build
 
@@ -381,7 +546,7 @@ class CloudBuildHook(GoogleBaseHook):
         """
         client = self.get_conn(location=location)
 
-        self.log.info("Start retrieving build trigger: %s.", trigger_id)
+        self.log.debug("Start retrieving build trigger: %s.", trigger_id)
 
         trigger = client.get_build_trigger(
             request={"project_id": project_id, "trigger_id": trigger_id},
@@ -390,7 +555,7 @@ class CloudBuildHook(GoogleBaseHook):
             metadata=metadata,
         )
 
-        self.log.info("Build trigger has been retrieved: %s.", trigger_id)
+        self.log.debug("Build trigger has been retrieved: %s.", trigger_id)
 
         return trigger
 
@@ -424,7 +589,7 @@ class CloudBuildHook(GoogleBaseHook):
 
         parent = f"projects/{project_id}/locations/{location}"
 
-        self.log.info("Start retrieving build triggers.")
+        self.log.debug("Start retrieving build triggers.")
 
         response = client.list_build_triggers(
             request={
@@ -438,10 +603,55 @@ class CloudBuildHook(GoogleBaseHook):
             metadata=metadata,
         )
 
-        self.log.info("Build triggers have been retrieved.")
+        self.log.debug("Build triggers have been retrieved.")
 
         return list(response.triggers)
 
+    @GoogleBaseHook.fallback_to_default_project_id
+    def list_build_triggers_stream(
+        self,
+        location: str = "global",
+        project_id: str = PROVIDE_PROJECT_ID,
+        page_size: int | None = None,
+        retry: Retry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+    ) -> Iterator[BuildTrigger]:
+        """
+        Yield all existing BuildTriggers, following pagination.
+
+        The next page is fetched in a background thread while the triggers of the current page are
+        consumed, which hides the latency of the page requests behind the work of the caller.
+
+        :param project_id: Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the GCP connection is used.
+        :param location: The location of the project.
+        :param page_size: Optional, number of results to return in a single page.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        """
+        client = self.get_conn(location=location)
+
+        response = client.list_build_triggers(
+            request={
+                "parent": f"projects/{project_id}/locations/{location}",
+                "project_id": project_id,
+                "page_size": page_size,
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        pages = iter(response.pages)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(next, pages, None)
+            while (page := next_page.result()) is not None:
+                next_page = executor.submit(next, pages, None)
+                yield from page.triggers
+
     @GoogleBaseHook.fallback_to_default_project_id
     def list_builds(
         self,
@@ -457,6 +667,8 @@ class CloudBuildHook(GoogleBaseHook):
         """
         List previously requested builds.
 
+        Only the first page of builds is returned. Use ``list_builds_pages`` to go through every page.
+
         :param project_id: Google Cloud Project project_id where the function belongs.
             If set to None or missing, the default project_id from the Google Cloud connection is used.
         :param location: The location of the project.
@@ -474,7 +686,7 @@ class CloudBuildHook(GoogleBaseHook):
 
         parent = f"projects/{project_id}/locations/{location}"
 
-        self.log.info("Start retrieving builds.")
+        self.log.debug("Start retrieving builds.")
 
         response = client.list_builds(
             request={
@@ -489,10 +701,53 @@ class CloudBuildHook(GoogleBaseHook):
             metadata=metadata,
         )
 
-        self.log.info("Builds have been retrieved.")
+        self.log.debug("Builds have been retrieved.")
 
         return list(response.builds)
 
+    @GoogleBaseHook.fallback_to_default_project_id
+    def list_builds_pages(
+        self,
+        location: str = "global",
+        project_id: str = PROVIDE_PROJECT_ID,
+        page_size: int | None = None,
+        filter_: str | None = None,
+        retry: Retry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+    ) -> Iterator[Sequence[Build]]:
+        """
+        Yield previously requested builds one page at a time.
+
+        Pages are only fetched when iterated, so that at most one page of builds is held in memory.
+
+        :param project_id: Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the Google Cloud connection is used.
+        :param location: The location of the project.
+        :param page_size: Optional, number of results to return in a single page.
+        :param filter_: Optional, the raw filter text to constrain the results.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        """
+        client = self.get_conn(location=location)
+
+        response = client.list_builds(
+            request={
+                "parent": f"projects/{project_id}/locations/{location}",
+                "project_id": project_id,
+                "page_size": page_size,
+                "filter": filter_,
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        for page in response.pages:
+            yield page.builds
+
     @GoogleBaseHook.fallback_to_default_project_id
     def retry_build(
         self,
@@ -535,9 +790,7 @@ class CloudBuildHook(GoogleBaseHook):
         if not wait:
             return self.get_build(id_=id_, project_id=project_id, location=location)
 
-        self.wait_for_operation(operation, timeout)
-
-        return self.get_build(id_=id_, project_id=project_id, location=location)
+        return self.wait_for_operation(operation, timeout)
 
     @GoogleBaseHook.fallback_to_default_project_id
     def run_build_trigger(
@@ -571,7 +824,11 @@ class CloudBuildHook(GoogleBaseHook):
 
         self.log.info("Start running build trigger: %s.", trigger_id)
         operation = client.run_build_trigger(
-            request={"project_id": project_id, "trigger_id": trigger_id, "source": source},
+            request={
+                "project_id": project_id,
+                "trigger_id": trigger_id,
+                "source": _to_message(RepoSource, source),
+            },
             retry=retry,
             timeout=timeout,
             metadata=metadata,
@@ -584,9 +841,7 @@ class CloudBuildHook(GoogleBaseHook):
         if not wait:
             return self.get_build(id_=id_, project_id=project_id, location=location)
 
-        self.wait_for_operation(operation, timeout)
-
-        return self.get_build(id_=id_, project_id=project_id, location=location)
+        return self.wait_for_operation(operation, timeout)
 
     @GoogleBaseHook.fallback_to_default_project_id
     def update_build_trigger(
@@ -619,7 +874,11 @@ class CloudBuildHook(GoogleBaseHook):
         self.log.info("Start updating build trigger: %s.", trigger_id)
 
         trigger = client.update_build_trigger(
-            request={"project_id": project_id, "trigger_id": trigger_id, "trigger": trigger},
+            request={
+                "project_id": project_id,
+                "trigger_id": trigger_id,
+                "trigger": _to_message(BuildTrigger, trigger),
+            },
             retry=retry,
             timeout=timeout,
             metadata=metadata,
@@ -641,6 +900,37 @@ class CloudBuildAsyncHook(GoogleBaseHook):
             )
         super().__init__(**kwargs)
 
+    def _get_client(self, location: str = "global") -> CloudBuildAsyncClient:
+        client_options = None
+        if location != "global":
+            client_options = ClientOptions(api_endpoint=f"{location}-cloudbuild.googleapis.com:443")
+        return CloudBuildAsyncClient(
+            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
+        )
+
+    async def _wait_for_operation(self, operation: AsyncOperation, timeout: float | None = None):
+        """
+        Wait for long-lasting operation to complete without blocking the event loop.
+
+        The operation is polled with the same backoff as ``OPERATION_POLLING``. Unlike the default retry
+        of ``AsyncOperation.result``, which gives up after two minutes, there is no deadline unless
+        ``timeout`` is given.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = _POLLING_INITIAL_DELAY
+        while not await operation.done():
+            sleep = delay if deadline is None else min(delay, deadline - time.monotonic())
+            if sleep <= 0:
+                raise AirflowException(f"Operation did not complete within {timeout} seconds.")
+            await asyncio.sleep(sleep)
+            delay = min(delay * _POLLING_MULTIPLIER, _POLLING_MAXIMUM_DELAY)
+        # The operation is done, so neither call polls again.
+        try:
+            return await operation.result()
+        except Exception:
+            error = await operation.exception()
+            raise AirflowException(error)
+
     @GoogleBaseHook.fallback_to_default_project_id
     async def get_cloud_build(
         self,
@@ -655,12 +945,7 @@ class CloudBuildAsyncHook(GoogleBaseHook):
         if not id_:
             raise AirflowException("Google Cloud Build id is required.")
 
-        client_options = None
-        if location != "global":
-            client_options = ClientOptions(api_endpoint=f"{location}-cloudbuild.googleapis.com:443")
-        client = CloudBuildAsyncClient(
-            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
-        )
+        client = self._get_client(location=location)
 
         request = GetBuildRequest(
             project_id=project_id,
@@ -673,3 +958,138 @@ class CloudBuildAsyncHook(GoogleBaseHook):
             metadata=metadata,
         )
         return build_instance
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def create_build(
+        self,
+        build: dict | Build,
+        project_id: str = PROVIDE_PROJECT_ID,
+        wait: bool = True,
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+        location: str = "global",
+    ) -> Build:
+        """
+        Start a build with the specified configuration.
+
+        :param build: The build resource to create. If a dict is provided, it must be of the same form
+            as the protobuf message `google.cloud.devtools.cloudbuild_v1.types.Build`
+        :param project_id: Optional, Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the GCP connection is used.
+        :param wait: Optional, wait for operation to finish.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        :param location: The location of the project.
+        """
+        client = self._get_client(location=location)
+
+        operation = await client.create_build(
+            request={
+                "parent": f"projects/{project_id}/locations/{location}",
+                "project_id": project_id,
+                "build": _to_message(Build, build),
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        id_ = CloudBuildHook._get_build_id_from_operation(operation)
+        self.log.info("Build has been created: %s.", id_)
+
+        if not wait:
+            return await self.get_cloud_build(id_=id_, project_id=project_id, location=location)
+
+        return await self._wait_for_operation(operation, timeout)
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def retry_build(
+        self,
+        id_: str,
+        project_id: str = PROVIDE_PROJECT_ID,
+        wait: bool = True,
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+        location: str = "global",
+    ) -> Build:
+        """
+        Create a new build using the original build request; may or may not result in an identical build.
+
+        :param id_: Build ID of the original build.
+        :param project_id: Optional, Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the GCP connection is used.
+        :param wait: Optional, wait for operation to finish.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        :param location: The location of the project.
+        """
+        client = self._get_client(location=location)
+
+        operation = await client.retry_build(
+            request={"project_id": project_id, "id": id_},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        id_ = CloudBuildHook._get_build_id_from_operation(operation)
+        self.log.info("Build has been retried: %s.", id_)
+
+        if not wait:
+            return await self.get_cloud_build(id_=id_, project_id=project_id, location=location)
+
+        return await self._wait_for_operation(operation, timeout)
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def run_build_trigger(
+        self,
+        trigger_id: str,
+        source: dict | RepoSource,
+        project_id: str = PROVIDE_PROJECT_ID,
+        wait: bool = True,
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+        location: str = "global",
+    ) -> Build:
+        """
+        Run a BuildTrigger at a particular source revision.
+
+        :param trigger_id: The ID of the trigger.
+        :param source: Source to build against this trigger. If a dict is provided, it must be of the
+            same form as the protobuf message `google.cloud.devtools.cloudbuild_v1.types.RepoSource`
+        :param project_id: Optional, Google Cloud Project project_id where the function belongs.
+            If set to None or missing, the default project_id from the GCP connection is used.
+        :param wait: Optional, wait for operation to finish.
+        :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
+            will not be retried.
+        :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
+            Note that if `retry` is specified, the timeout applies to each individual attempt.
+        :param metadata: Optional, additional metadata that is provided to the method.
+        :param location: The location of the project.
+        """
+        client = self._get_client(location=location)
+
+        operation = await client.run_build_trigger(
+            request={
+                "project_id": project_id,
+                "trigger_id": trigger_id,
+                "source": _to_message(RepoSource, source),
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        id_ = CloudBuildHook._get_build_id_from_operation(operation)
+        self.log.info("Build has been created: %s.", id_)
+
+        if not wait:
+            return await self.get_cloud_build(id_=id_, project_id=project_id, location=location)
+
+        return await self._wait_for_operation(operation, timeout)
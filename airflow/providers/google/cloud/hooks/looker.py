@@ -19,11 +19,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 import time
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from asgiref.sync import sync_to_async
 from looker_sdk.rtl import api_settings, auth_session, requests_transport, serialize
 from looker_sdk.sdk.api40 import methods as methods40
 from packaging.version import parse as parse_version
@@ -35,6 +38,12 @@ from airflow.version import version
 if TYPE_CHECKING:
     from airflow.models.connection import Connection
 
+# Origin of the requests, reported to Looker when starting and stopping PDT builds.
+API_SOURCE = f"airflow:{version}"
+
+# Oldest Looker release that supports the PDT materialization API.
+MIN_PDT_BUILD_LOOKER_VERSION = parse_version("22.2.0")
+
 
 class LookerHook(BaseHook):
     """Hook for Looker APIs."""
@@ -46,7 +55,8 @@ class LookerHook(BaseHook):
         super().__init__()
         self.looker_conn_id = looker_conn_id
         # source is used to track origin of the requests
-        self.source = f"airflow:{version}"
+        self.source = API_SOURCE
+        self._sdk: methods40.Looker40SDK | None = None
 
     def start_pdt_build(
         self,
@@ -66,7 +76,7 @@ class LookerHook(BaseHook):
 
         sdk = self.get_looker_sdk()
         looker_ver = sdk.versions().looker_release_version
-        if parse_version(looker_ver) < parse_version("22.2.0"):
+        if parse_version(looker_ver) < MIN_PDT_BUILD_LOOKER_VERSION:
             raise AirflowException(f"This API requires Looker version 22.2+. Found: {looker_ver}.")
 
         # unpack query_params dict into kwargs (if not None)
@@ -105,10 +115,7 @@ class LookerHook(BaseHook):
 
         :param materialization_id: Required. The materialization id to check status for.
         """
-        resp = self.check_pdt_build(materialization_id=materialization_id)
-
-        status_json = resp["resp_text"]
-        status_dict = json.loads(status_json)
+        status_dict = self._check_pdt_build_parsed(materialization_id=materialization_id)
 
         self.log.info(
             "PDT materialization job id: %s. Status: '%s'.", materialization_id, status_dict["status"]
@@ -116,6 +123,12 @@ class LookerHook(BaseHook):
 
         return status_dict
 
+    def _check_pdt_build_parsed(self, materialization_id: str) -> dict:
+        """Get the PDT materialization job status from Looker, parsed from the response text."""
+        self.log.debug("Requesting PDT materialization job status. Job id: %s.", materialization_id)
+        resp = self.get_looker_sdk().check_pdt_build(materialization_id=materialization_id)
+        return json.loads(resp["resp_text"])
+
     def stop_pdt_build(
         self,
         materialization_id: str,
@@ -139,38 +152,106 @@ class LookerHook(BaseHook):
         materialization_id: str,
         wait_time: int = 10,
         timeout: int | None = None,
+        max_wait_time: int = 300,
+        backoff_factor: float = 1.5,
     ) -> None:
         """
         Poll a PDT materialization job to check if it finishes.
 
         :param materialization_id: Required. The materialization id to wait for.
-        :param wait_time: Optional. Number of seconds between checks.
+        :param wait_time: Optional. Number of seconds between the first two checks.
         :param timeout: Optional. How many seconds wait for job to be ready.
             Used only if ``asynchronous`` is False.
+        :param max_wait_time: Optional. Maximum number of seconds between checks.
+        :param backoff_factor: Optional. Factor by which the time between checks grows after each check.
         """
         self.log.info("Waiting for PDT materialization job to complete. Job id: %s.", materialization_id)
 
-        status = None
-        start = time.monotonic()
+        deadline = time.monotonic() + timeout if timeout else None
+        current_wait_time: float = wait_time
+
+        # Check the job right away, it may already be finished.
+        status_dict = self.pdt_build_status(materialization_id=materialization_id)
+        status = status_dict["status"]
 
-        while status not in (
-            JobStatus.DONE.value,
-            JobStatus.ERROR.value,
-            JobStatus.CANCELLED.value,
-            JobStatus.UNKNOWN.value,
-        ):
-            if timeout and start + timeout < time.monotonic():
+        while status not in TERMINAL_JOB_STATUSES:
+            if deadline is not None and time.monotonic() > deadline:
                 self.stop_pdt_build(materialization_id=materialization_id)
                 raise AirflowException(
                     f"Timeout: PDT materialization job is not ready after {timeout}s. "
                     f"Job id: {materialization_id}."
                 )
 
-            time.sleep(wait_time)
+            time.sleep(self._get_sleep_time(current_wait_time, deadline))
+            current_wait_time = min(max_wait_time, current_wait_time * backoff_factor)
 
             status_dict = self.pdt_build_status(materialization_id=materialization_id)
             status = status_dict["status"]
 
+        self._check_job_completed(materialization_id=materialization_id, status_dict=status_dict)
+
+    async def async_wait_for_job(
+        self,
+        materialization_id: str,
+        wait_time: int = 10,
+        timeout: int | None = None,
+        max_wait_time: int = 300,
+        backoff_factor: float = 1.5,
+    ) -> None:
+        """
+        Poll a PDT materialization job to check if it finishes, without blocking the event loop.
+
+        :param materialization_id: Required. The materialization id to wait for.
+        :param wait_time: Optional. Number of seconds between the first two checks.
+        :param timeout: Optional. How many seconds wait for job to be ready.
+        :param max_wait_time: Optional. Maximum number of seconds between checks.
+        :param backoff_factor: Optional. Factor by which the time between checks grows after each check.
+        """
+        self.log.info("Waiting for PDT materialization job to complete. Job id: %s.", materialization_id)
+
+        deadline = time.monotonic() + timeout if timeout else None
+        current_wait_time: float = wait_time
+        # Not thread sensitive, so that polls from concurrent triggers do not queue on a single thread.
+        pdt_build_status = sync_to_async(self.pdt_build_status, thread_sensitive=False)
+
+        # Check the job right away, it may already be finished.
+        status_dict = await pdt_build_status(materialization_id=materialization_id)
+        status = status_dict["status"]
+
+        while status not in TERMINAL_JOB_STATUSES:
+            if deadline is not None and time.monotonic() > deadline:
+                await sync_to_async(self.stop_pdt_build, thread_sensitive=False)(
+                    materialization_id=materialization_id
+                )
+                raise AirflowException(
+                    f"Timeout: PDT materialization job is not ready after {timeout}s. "
+                    f"Job id: {materialization_id}."
+                )
+
+            await asyncio.sleep(self._get_sleep_time(current_wait_time, deadline))
+            current_wait_time = min(max_wait_time, current_wait_time * backoff_factor)
+
+            status_dict = await pdt_build_status(materialization_id=materialization_id)
+            status = status_dict["status"]
+
+        self._check_job_completed(materialization_id=materialization_id, status_dict=status_dict)
+
+    @staticmethod
+    def _get_sleep_time(wait_time: float, deadline: float | None) -> float:
+        """
+        Return the time to sleep before the next check.
+
+        Up to 10% of random jitter is added to the wait time, so that concurrent waits do not poll in sync,
+        and the result never sleeps past the deadline.
+        """
+        sleep_time = wait_time + random.uniform(0, wait_time * 0.1)
+        if deadline is not None:
+            sleep_time = max(0.0, min(sleep_time, deadline - time.monotonic()))
+        return sleep_time
+
+    def _check_job_completed(self, materialization_id: str, status_dict: dict) -> None:
+        """Raise if the final status of a PDT materialization job is not a success."""
+        status = status_dict["status"]
         if status == JobStatus.ERROR.value:
             msg = status_dict["message"]
             raise AirflowException(
@@ -186,18 +267,25 @@ class LookerHook(BaseHook):
         self.log.info("PDT materialization job completed successfully. Job id: %s.", materialization_id)
 
     def get_looker_sdk(self):
-        """Return Looker SDK client for Looker API 4.0."""
-        conn = self.get_connection(self.looker_conn_id)
-        settings = LookerApiSettings(conn)
-
-        transport = requests_transport.RequestsTransport.configure(settings)
-        return methods40.Looker40SDK(
-            auth_session.AuthSession(settings, transport, serialize.deserialize40, "4.0"),
-            serialize.deserialize40,
-            serialize.serialize40,
-            transport,
-            "4.0",
-        )
+        """
+        Return Looker SDK client for Looker API 4.0.
+
+        The client is created once per hook, so that its transport session and authentication token
+        are reused by all subsequent calls, e.g. while polling in ``wait_for_job``.
+        """
+        if self._sdk is None:
+            conn = self.get_connection(self.looker_conn_id)
+            settings = LookerApiSettings(conn)
+
+            transport = requests_transport.RequestsTransport.configure(settings)
+            self._sdk = methods40.Looker40SDK(
+                auth_session.AuthSession(settings, transport, serialize.deserialize40, "4.0"),
+                serialize.deserialize40,
+                serialize.serialize40,
+                transport,
+                "4.0",
+            )
+        return self._sdk
 
 
 class LookerApiSettings(api_settings.ApiSettings):
@@ -257,3 +345,14 @@ class JobStatus(Enum):
     DONE = "complete"
     ERROR = "error"
     UNKNOWN = "unknown"
+
+
+# Values of the job statuses after which a PDT materialization job does not change anymore.
+TERMINAL_JOB_STATUSES = frozenset(
+    {
+        JobStatus.DONE.value,
+        JobStatus.ERROR.value,
+        JobStatus.CANCELLED.value,
+        JobStatus.UNKNOWN.value,
+    }
+)
@@ -20,18 +20,23 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Sequence
 
+from asgiref.sync import sync_to_async
 from google.api_core.client_options import ClientOptions
 from google.api_core.gapic_v1.method import DEFAULT, _MethodDefault
-from google.cloud.aiplatform_v1 import ModelServiceClient
+from google.cloud.aiplatform_v1 import ModelServiceAsyncClient, ModelServiceClient
 
 from airflow.exceptions import AirflowException
-from airflow.providers.google.common.hooks.base_google import GoogleBaseHook
+from airflow.providers.google.common.consts import CLIENT_INFO
+from airflow.providers.google.common.hooks.base_google import GoogleBaseAsyncHook, GoogleBaseHook
 
 if TYPE_CHECKING:
     from google.api_core.operation import Operation
+    from google.api_core.operation_async import AsyncOperation
     from google.api_core.retry import Retry
+    from google.api_core.retry_async import AsyncRetry
     from google.cloud.aiplatform_v1.services.model_service.pagers import (
         ListModelsPager,
         ListModelVersionsPager,
@@ -39,6 +44,16 @@ if TYPE_CHECKING:
     from google.cloud.aiplatform_v1.types import Model, model_service
 
 
+def _model_path(project_id: str, region: str, model: str) -> str:
+    """Return the resource name of a model, as built by ``ModelServiceClient.model_path``."""
+    return f"projects/{project_id}/locations/{region}/models/{model}"
+
+
+def _location_path(project_id: str, region: str) -> str:
+    """Return the resource name of a location, as built by ``ModelServiceClient.common_location_path``."""
+    return f"projects/{project_id}/locations/{region}"
+
+
 class ModelServiceHook(GoogleBaseHook):
     """Hook for Google Cloud Vertex AI Endpoint Service APIs."""
 
@@ -49,17 +64,23 @@ class ModelServiceHook(GoogleBaseHook):
                 " of Google Provider. You MUST convert it to `impersonate_chain`"
             )
         super().__init__(**kwargs)
+        self._clients: dict[str, ModelServiceClient] = {}
 
     def get_model_service_client(self, region: str | None = None) -> ModelServiceClient:
-        """Return ModelServiceClient object."""
-        if region and region != "global":
-            client_options = ClientOptions(api_endpoint=f"{region}-aiplatform.googleapis.com:443")
-        else:
-            client_options = ClientOptions()
-
-        return ModelServiceClient(
-            credentials=self.get_credentials(), client_info=self.client_info, client_options=client_options
-        )
+        """Return ModelServiceClient object, shared by all calls of the hook for the same region."""
+        key = region or "global"
+        if key not in self._clients:
+            if key != "global":
+                client_options = ClientOptions(api_endpoint=f"{region}-aiplatform.googleapis.com:443")
+            else:
+                client_options = ClientOptions()
+
+            self._clients[key] = ModelServiceClient(
+                credentials=self.get_credentials(),
+                client_info=self.client_info,
+                client_options=client_options,
+            )
+        return self._clients[key]
 
     @staticmethod
     def extract_model_id(obj: dict) -> str:
@@ -95,7 +116,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model)
+        name = _model_path(project_id, region, model)
 
         result = client.delete_model(
             request={
@@ -130,7 +151,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model)
+        name = _model_path(project_id, region, model)
 
         result = client.export_model(
             request={
@@ -185,7 +206,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        parent = client.common_location_path(project_id, region)
+        parent = _location_path(project_id, region)
 
         result = client.list_models(
             request={
@@ -223,7 +244,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        parent = client.common_location_path(project_id, region)
+        parent = _location_path(project_id, region)
 
         result = client.upload_model(
             request={
@@ -257,7 +278,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
 
         result = client.list_model_versions(
             request={
@@ -290,7 +311,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
 
         result = client.delete_model_version(
             request={
@@ -323,7 +344,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
 
         result = client.get_model(
             request={
@@ -356,7 +377,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
 
         result = client.merge_version_aliases(
             request={
@@ -392,7 +413,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
 
         for alias in version_aliases:
             if alias.startswith("-"):
@@ -432,7 +453,7 @@ class ModelServiceHook(GoogleBaseHook):
         :param metadata: Strings which should be sent along with the request as metadata.
         """
         client = self.get_model_service_client(region)
-        name = client.model_path(project_id, region, model_id)
+        name = _model_path(project_id, region, model_id)
         if "default" in version_aliases:
             raise AirflowException(
                 "Default alias can't be deleted. "
@@ -450,3 +471,149 @@ class ModelServiceHook(GoogleBaseHook):
             metadata=metadata,
         )
         return result
+
+
+class ModelServiceAsyncHook(GoogleBaseAsyncHook):
+    """Hook for Google Cloud Vertex AI Model Service Async APIs."""
+
+    sync_hook_class = ModelServiceHook
+
+    def __init__(
+        self,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: str | Sequence[str] | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            gcp_conn_id=gcp_conn_id,
+            impersonation_chain=impersonation_chain,
+            **kwargs,
+        )
+        self._clients: dict[str, ModelServiceAsyncClient] = {}
+
+    async def get_model_service_client(self, region: str | None = None) -> ModelServiceAsyncClient:
+        """Return ModelServiceAsyncClient object, shared by all calls of the hook for the same region."""
+        key = region or "global"
+        if key not in self._clients:
+            sync_hook = await self.get_sync_hook()
+            # Deriving credentials may do blocking I/O (key files, token exchange), keep it off the loop.
+            credentials = await sync_to_async(sync_hook.get_credentials, thread_sensitive=False)()
+            endpoint = f"{region}-aiplatform.googleapis.com:443" if key != "global" else None
+            self._clients[key] = ModelServiceAsyncClient(
+                credentials=credentials,
+                client_info=CLIENT_INFO,
+                client_options=ClientOptions(api_endpoint=endpoint),
+            )
+        return self._clients[key]
+
+    async def list_models(
+        self,
+        project_id: str,
+        region: str,
+        filter: str | None = None,
+        page_size: int | None = None,
+        read_mask: str | None = None,
+        order_by: str | None = None,
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+    ) -> list[Model]:
+        """
+        List all Models in a Location, following pagination without blocking the event loop.
+
+        :param project_id: Required. The ID of the Google Cloud project that the service belongs to.
+        :param region: Required. The ID of the Google Cloud region that the service belongs to.
+        :param filter: An expression for filtering the results of the request. For field names both
+            snake_case and camelCase are supported.
+        :param page_size: The standard list page size. Larger pages mean fewer round-trips.
+        :param read_mask: Mask specifying which fields to read.
+        :param order_by: A comma-separated list of fields to order by, sorted in ascending order. Use "desc"
+            after a field name for descending.
+        :param retry: Designation of what errors, if any, should be retried.
+        :param timeout: The timeout for this request.
+        :param metadata: Strings which should be sent along with the request as metadata.
+        """
+        client = await self.get_model_service_client(region)
+        parent = _location_path(project_id, region)
+
+        pager = await client.list_models(
+            request={
+                "parent": parent,
+                "filter": filter,
+                "page_size": page_size,
+                "read_mask": read_mask,
+                "order_by": order_by,
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return [model async for model in pager]
+
+    async def delete_models(
+        self,
+        project_id: str,
+        region: str,
+        models: Sequence[str],
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+    ) -> list[AsyncOperation]:
+        """
+        Delete several Models concurrently.
+
+        :param project_id: Required. The ID of the Google Cloud project that the service belongs to.
+        :param region: Required. The ID of the Google Cloud region that the service belongs to.
+        :param models: Required. The names of the Model resources to be deleted.
+        :param retry: Designation of what errors, if any, should be retried.
+        :param timeout: The timeout for each request.
+        :param metadata: Strings which should be sent along with the requests as metadata.
+        :return: The delete operations, in the same order as ``models``.
+        """
+        client = await self.get_model_service_client(region)
+        return await asyncio.gather(
+            *(
+                client.delete_model(
+                    request={"name": _model_path(project_id, region, model)},
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                )
+                for model in models
+            )
+        )
+
+    async def export_models(
+        self,
+        project_id: str,
+        region: str,
+        models: Sequence[str],
+        output_config: model_service.ExportModelRequest.OutputConfig | dict,
+        retry: AsyncRetry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+    ) -> list[AsyncOperation]:
+        """
+        Export several trained, exportable Models concurrently to a location specified by the user.
+
+        :param project_id: Required. The ID of the Google Cloud project that the service belongs to.
+        :param region: Required. The ID of the Google Cloud region that the service belongs to.
+        :param models: Required. The resource names of the Models to export.
+        :param output_config:  Required. The desired output location and configuration.
+        :param retry: Designation of what errors, if any, should be retried.
+        :param timeout: The timeout for each request.
+        :param metadata: Strings which should be sent along with the requests as metadata.
+        :return: The export operations, in the same order as ``models``.
+        """
+        client = await self.get_model_service_client(region)
+        return await asyncio.gather(
+            *(
+                client.export_model(
+                    request={"name": _model_path(project_id, region, model), "output_config": output_config},
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                )
+                for model in models
+            )
+        )
@@ -21,9 +21,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.providers.google.cloud.hooks.looker import LookerHook
 from airflow.providers.google.cloud.operators.cloud_base import GoogleCloudBaseOperator
+from airflow.providers.google.cloud.triggers.looker import LookerCheckPdtBuildTrigger
+from airflow.providers.google.common.consts import GOOGLE_DEFAULT_DEFERRABLE_METHOD_NAME
 
 if TYPE_CHECKING:
     from airflow.utils.context import Context
@@ -43,10 +46,13 @@ class LookerStartPdtBuildOperator(GoogleCloudBaseOperator):
         waiting on them asynchronously using the LookerCheckPdtBuildSensor
     :param cancel_on_kill: Optional. Flag which indicates whether cancel the
         hook's job or not, when on_kill is called.
-    :param wait_time: Optional. Number of seconds between checks for job to be
-        ready. Used only if ``asynchronous`` is False.
+    :param wait_time: Optional. Number of seconds between the first two checks for job
+        to be ready; the time between checks then grows exponentially.
+        Used only if ``asynchronous`` is False.
     :param wait_timeout: Optional. How many seconds wait for job to be ready.
         Used only if ``asynchronous`` is False.
+    :param deferrable: Optional. Run operator in the deferrable mode, waiting for the job
+        on the triggerer instead of the worker. Used only if ``asynchronous`` is False.
     """
 
     def __init__(
@@ -59,6 +65,7 @@ class LookerStartPdtBuildOperator(GoogleCloudBaseOperator):
         cancel_on_kill: bool = True,
         wait_time: int = 10,
         wait_timeout: int | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -70,6 +77,7 @@ class LookerStartPdtBuildOperator(GoogleCloudBaseOperator):
         self.cancel_on_kill = cancel_on_kill
         self.wait_time = wait_time
         self.wait_timeout = wait_timeout
+        self.deferrable = deferrable
         self.hook: LookerHook | None = None
         self.materialization_id: str | None = None
 
@@ -91,15 +99,34 @@ class LookerStartPdtBuildOperator(GoogleCloudBaseOperator):
 
         self.log.info("PDT materialization job submitted successfully. Job id: %s.", self.materialization_id)
 
-        if not self.asynchronous:
-            self.hook.wait_for_job(
-                materialization_id=self.materialization_id,
-                wait_time=self.wait_time,
-                timeout=self.wait_timeout,
+        if self.asynchronous:
+            return self.materialization_id
+
+        if self.deferrable:
+            self.defer(
+                trigger=LookerCheckPdtBuildTrigger(
+                    looker_conn_id=self.looker_conn_id,
+                    materialization_id=self.materialization_id,
+                    wait_time=self.wait_time,
+                    timeout=self.wait_timeout,
+                ),
+                method_name=GOOGLE_DEFAULT_DEFERRABLE_METHOD_NAME,
             )
 
+        self.hook.wait_for_job(
+            materialization_id=self.materialization_id,
+            wait_time=self.wait_time,
+            timeout=self.wait_timeout,
+        )
+
         return self.materialization_id
 
+    def execute_complete(self, context: Context, event: dict) -> str:
+        if event["status"] != "success":
+            raise AirflowException(event["message"])
+        self.log.info("%s Job id: %s.", event["message"], event["materialization_id"])
+        return event["materialization_id"]
+
     def on_kill(self):
         if self.materialization_id and self.cancel_on_kill:
             self.hook.stop_pdt_build(materialization_id=self.materialization_id)
@@ -0,0 +1,84 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""This module contains Google Cloud Looker triggers."""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+from airflow.providers.google.cloud.hooks.looker import LookerHook
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+class LookerCheckPdtBuildTrigger(BaseTrigger):
+    """
+    Wait on the triggerer for a Looker PDT materialization job to finish.
+
+    :param looker_conn_id: Required. The connection ID to use connecting to Looker.
+    :param materialization_id: Required. The materialization id to wait for.
+    :param wait_time: Optional. Number of seconds between checks.
+    :param timeout: Optional. How many seconds wait for job to be ready.
+    """
+
+    def __init__(
+        self,
+        looker_conn_id: str,
+        materialization_id: str,
+        wait_time: int = 10,
+        timeout: int | None = None,
+    ):
+        super().__init__()
+        self.looker_conn_id = looker_conn_id
+        self.materialization_id = materialization_id
+        self.wait_time = wait_time
+        self.timeout = timeout
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        """Serialize LookerCheckPdtBuildTrigger arguments and classpath."""
+        return (
+            "airflow.providers.google.cloud.triggers.looker.LookerCheckPdtBuildTrigger",
+            {
+                "looker_conn_id": self.looker_conn_id,
+                "materialization_id": self.materialization_id,
+                "wait_time": self.wait_time,
+                "timeout": self.timeout,
+            },
+        )
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:  # type: ignore[override]
+        """Wait for the PDT materialization job and yield a TriggerEvent with its outcome."""
+        hook = LookerHook(looker_conn_id=self.looker_conn_id)
+        try:
+            await hook.async_wait_for_job(
+                materialization_id=self.materialization_id,
+                wait_time=self.wait_time,
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            self.log.exception("Exception occurred while waiting for PDT materialization job")
+            yield TriggerEvent(
+                {"status": "error", "materialization_id": self.materialization_id, "message": str(e)}
+            )
+            return
+        yield TriggerEvent(
+            {
+                "status": "success",
+                "materialization_id": self.materialization_id,
+                "message": "PDT materialization job completed",
+            }
+        )
@@ -17,10 +17,12 @@
 # under the License.
 from __future__ import annotations
 
+import time
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
 from azure.common.client_factory import get_client_from_auth_file, get_client_from_json_dict
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import ClientSecretCredential, DefaultAzureCredential
 from azure.mgmt.containerinstance import ContainerInstanceManagementClient
 from deprecated import deprecated
@@ -57,8 +59,13 @@ class AzureContainerInstanceHook(AzureBaseHook):
     conn_type = "azure_container_instance"
     hook_name = "Azure Container Instance"
 
+    # Number of seconds for which a container group fetched by get_state is reused by the helpers
+    # reading details from it.
+    state_cache_ttl = 2.0
+
     def __init__(self, azure_conn_id: str = default_conn_name) -> None:
         super().__init__(sdk_client=ContainerInstanceManagementClient, conn_id=azure_conn_id)
+        self._state_cache: dict[tuple[str, str], tuple[float, ContainerGroup]] = {}
 
     @cached_property
     def connection(self):
@@ -71,16 +78,17 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :return: the authenticated client.
         """
         conn = self.get_connection(self.conn_id)
-        tenant = conn.extra_dejson.get("tenantId")
+        extras = conn.extra_dejson
+        tenant = extras.get("tenantId")
 
-        key_path = conn.extra_dejson.get("key_path")
+        key_path = extras.get("key_path")
         if key_path:
             if not key_path.endswith(".json"):
                 raise AirflowException("Unrecognised extension for key file.")
             self.log.info("Getting connection using a JSON key file.")
             return get_client_from_auth_file(client_class=self.sdk_client, auth_path=key_path)
 
-        key_json = conn.extra_dejson.get("key_json")
+        key_json = extras.get("key_json")
         if key_json:
             self.log.info("Getting connection using a JSON config.")
             return get_client_from_json_dict(client_class=self.sdk_client, config_dict=key_json)
@@ -93,14 +101,14 @@ class AzureContainerInstanceHook(AzureBaseHook):
             )
         else:
             self.log.info("Using DefaultAzureCredential as credential")
-            managed_identity_client_id = conn.extra_dejson.get("managed_identity_client_id")
-            workload_identity_tenant_id = conn.extra_dejson.get("workload_identity_tenant_id")
+            managed_identity_client_id = extras.get("managed_identity_client_id")
+            workload_identity_tenant_id = extras.get("workload_identity_tenant_id")
             credential = get_sync_default_azure_credential(
                 managed_identity_client_id=managed_identity_client_id,
                 workload_identity_tenant_id=workload_identity_tenant_id,
             )
 
-        subscription_id = cast(str, conn.extra_dejson.get("subscriptionId"))
+        subscription_id = cast(str, extras.get("subscriptionId"))
         return ContainerInstanceManagementClient(
             credential=credential,
             subscription_id=subscription_id,
@@ -129,7 +137,7 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :return: A tuple with the state, exitcode, and details.
             If the exitcode is unknown 0 is returned.
         """
-        cg_state = self.get_state(resource_group, name)
+        cg_state = self._get_recent_state(resource_group, name)
         container = cg_state.containers[0]
         instance_view: ContainerPropertiesInstanceView = container.instance_view  # type: ignore[assignment]
         c_state: ContainerState = instance_view.current_state  # type: ignore[assignment]
@@ -147,7 +155,7 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :param name: the name of the container group
         :return: A list of the event messages
         """
-        cg_state = self.get_state(resource_group, name)
+        cg_state = self._get_recent_state(resource_group, name)
         container = cg_state.containers[0]
         instance_view: ContainerPropertiesInstanceView = container.instance_view  # type: ignore[assignment]
         events: list[Event] = instance_view.events  # type: ignore[assignment]
@@ -161,7 +169,16 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :param name: the name of the container group
         :return: ContainerGroup
         """
-        return self.connection.container_groups.get(resource_group, name)
+        cg_state = self.connection.container_groups.get(resource_group, name)
+        self._state_cache[(resource_group, name)] = (time.monotonic(), cg_state)
+        return cg_state
+
+    def _get_recent_state(self, resource_group: str, name: str) -> ContainerGroup:
+        """Return the container group fetched by get_state if it is recent enough, or fetch it again."""
+        cached = self._state_cache.get((resource_group, name))
+        if cached is not None and time.monotonic() - cached[0] < self.state_cache_ttl:
+            return cached[1]
+        return self.get_state(resource_group, name)
 
     def get_logs(self, resource_group: str, name: str, tail: int = 1000) -> list:
         """
@@ -184,6 +201,7 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :param resource_group: the name of the resource group
         :param name: the name of the container group
         """
+        self._state_cache.pop((resource_group, name), None)
         self.connection.container_groups.begin_delete(resource_group, name)
 
     def exists(self, resource_group: str, name: str) -> bool:
@@ -193,10 +211,15 @@ class AzureContainerInstanceHook(AzureBaseHook):
         :param resource_group: the name of the resource group
         :param name: the name of the container group
         """
-        for container in self.connection.container_groups.list_by_resource_group(resource_group):
-            if container.name == name:
-                return True
-        return False
+        try:
+            self.connection.container_groups.get(resource_group, name)
+        except ResourceNotFoundError as e:
+            # A missing resource group is reported with the same exception, but it is not a missing
+            # container group and must not be hidden.
+            if getattr(e.error, "code", None) == "ResourceNotFound":
+                return False
+            raise
+        return True
 
     def test_connection(self):
         """Test a configured Azure Container Instance connection."""
@@ -53,6 +53,13 @@ if TYPE_CHECKING:
     from airflow.models import Connection
 
 
+# Passed to every request, so it is built once. Treat it as read-only, it is shared by all hooks.
+_ERROR_MAPPING: dict[str, ParsableFactory | None] = {
+    "4XX": APIError,
+    "5XX": APIError,
+}
+
+
 class DefaultResponseHandler(ResponseHandler):
     """DefaultResponseHandler returns JSON payload or content in bytes or response headers."""
 
@@ -201,6 +208,7 @@ class KiotaRequestAdapterHook(BaseHook):
             scopes = config.get("scopes", ["https://graph.microsoft.com/.default"])
             verify = config.get("verify", True)
             trust_env = config.get("trust_env", False)
+            http2 = config.get("http2", False)
             disable_instance_discovery = config.get("disable_instance_discovery", False)
             allowed_hosts = (config.get("allowed_hosts", authority) or "").split(",")
 
@@ -219,6 +227,7 @@ class KiotaRequestAdapterHook(BaseHook):
             self.log.info("Verify: %s", verify)
             self.log.info("Timeout: %s", self.timeout)
             self.log.info("Trust env: %s", trust_env)
+            self.log.info("HTTP/2: %s", http2)
             self.log.info("Authority: %s", authority)
             self.log.info("Disable instance discovery: %s", disable_instance_discovery)
             self.log.info("Allowed hosts: %s", allowed_hosts)
@@ -241,6 +250,10 @@ class KiotaRequestAdapterHook(BaseHook):
                     timeout=Timeout(timeout=self.timeout),
                     verify=verify,
                     trust_env=trust_env,
+                    http2=http2,
+                    # The adapter is cached per conn_id, so keep its connections alive between
+                    # triggers instead of doing a new TLS handshake for each request.
+                    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
                 ),
                 host=host,
             )
@@ -335,9 +348,7 @@ class KiotaRequestAdapterHook(BaseHook):
 
     @staticmethod
     def normalize_url(url: str) -> str | None:
-        if url.startswith("/"):
-            return url.replace("/", "", 1)
-        return url
+        return url[1:] if url.startswith("/") else url
 
     @staticmethod
     def encoded_query_parameters(query_parameters) -> dict:
@@ -347,7 +358,4 @@ class KiotaRequestAdapterHook(BaseHook):
 
     @staticmethod
     def error_mapping() -> dict[str, ParsableFactory | None]:
-        return {
-            "4XX": APIError,
-            "5XX": APIError,
-        }
+        return _ERROR_MAPPING
@@ -19,61 +19,91 @@ from __future__ import annotations
 
 import json
 import locale
-from base64 import b64encode
+from base64 import b64decode, b64encode
 from contextlib import suppress
 from datetime import datetime
+from io import BytesIO
 from json import JSONDecodeError
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Callable,
     Sequence,
 )
 from uuid import UUID
 
-import pendulum
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from airflow.providers.microsoft.azure.hooks.msgraph import KiotaRequestAdapterHook
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils.module_loading import import_string
 
 if TYPE_CHECKING:
-    from io import BytesIO
-
     from kiota_abstractions.request_adapter import RequestAdapter
     from kiota_abstractions.request_information import QueryParams
     from kiota_http.httpx_request_adapter import ResponseType
     from msgraph_core import APIVersion
 
 
+_CONVERTERS: dict[type, Callable[[Any], str]] = {
+    UUID: str,
+    datetime: datetime.isoformat,
+}
+
+
+def _convert(value) -> str | None:
+    if value is None:
+        return None
+    converter = _CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    # Subclasses, e.g. pendulum.DateTime, aren't in the lookup table.
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable!")
+
+
+_DEFAULT_ENCODING = locale.getpreferredencoding(False)
+
+# json.dumps builds a new JSONEncoder on every call as soon as ``default`` is given, so keep one around.
+_JSON_ENCODER = json.JSONEncoder(default=_convert)
+
+
 class ResponseSerializer:
     """ResponseSerializer serializes the response as a string."""
 
     def __init__(self, encoding: str | None = None):
-        self.encoding = encoding or locale.getpreferredencoding()
+        self.encoding = encoding or _DEFAULT_ENCODING
 
     def serialize(self, response) -> str | None:
-        def convert(value) -> str | None:
-            if value is not None:
-                if isinstance(value, UUID):
-                    return str(value)
-                if isinstance(value, datetime):
-                    return value.isoformat()
-                if isinstance(value, pendulum.DateTime):
-                    return value.to_iso8601_string()  # Adjust the format as needed
-                raise TypeError(f"Object of type {type(value)} is not JSON serializable!")
+        if response is None:
             return None
-
-        if response is not None:
-            if isinstance(response, bytes):
-                return b64encode(response).decode(self.encoding)
-            with suppress(JSONDecodeError):
-                return json.dumps(response, default=convert)
-            return response
-        return None
+        if isinstance(response, bytes):
+            return b64encode(response).decode(self.encoding)
+        # Strings are still JSON encoded, so that deserialize() gives back a string and not
+        # whatever the string itself would parse to. Unserializable values raise a TypeError.
+        # The orjson output is compact and doesn't escape non-ASCII characters, unlike json.dumps,
+        # but it deserializes to the same value, except for NaN and infinity which orjson writes as null.
+        # orjson always produces UTF-8, whatever the encoding.
+        if orjson is not None:
+            try:
+                return orjson.dumps(response, default=_convert, option=orjson.OPT_NON_STR_KEYS).decode(
+                    "utf-8"
+                )
+            except orjson.JSONEncodeError:
+                # orjson rejects integers wider than 64 bits, which json handles fine.
+                pass
+        return _JSON_ENCODER.encode(response)
 
     def deserialize(self, response) -> Any:
         if isinstance(response, str):
+            # json, unlike orjson, keeps integers wider than 64 bits and reads NaN back.
             with suppress(JSONDecodeError):
                 response = json.loads(response)
         return response
@@ -96,6 +126,8 @@ class MSGraphTrigger(BaseTrigger):
         or you can pass a string as `v1.0` or `beta`.
     :param serializer: Class which handles response serialization (default is ResponseSerializer).
         Bytes will be base64 encoded into a string, so it can be stored as an XCom.
+    :param data_encoding: Set to `base64` when `data` is a base64 encoded string that has to be sent
+        as binary content. This is used when binary data is passed through the triggerer.
     """
 
     template_fields: Sequence[str] = (
@@ -124,6 +156,7 @@ class MSGraphTrigger(BaseTrigger):
         proxies: dict | None = None,
         api_version: APIVersion | None = None,
         serializer: type[ResponseSerializer] = ResponseSerializer,
+        data_encoding: str | None = None,
     ):
         super().__init__()
         self.hook = KiotaRequestAdapterHook(
@@ -139,6 +172,8 @@ class MSGraphTrigger(BaseTrigger):
         self.method = method
         self.query_parameters = query_parameters
         self.headers = headers
+        if data_encoding == "base64" and isinstance(data, str):
+            data = BytesIO(b64decode(data))
         self.data = data
         self.serializer: ResponseSerializer = self.resolve_type(serializer, default=ResponseSerializer)()
 
@@ -153,6 +188,12 @@ class MSGraphTrigger(BaseTrigger):
     def serialize(self) -> tuple[str, dict[str, Any]]:
         """Serialize the HttpTrigger arguments and classpath."""
         api_version = self.api_version.value if self.api_version else None
+        # Binary content can't be stored in the trigger kwargs as is, so it is base64 encoded.
+        data, data_encoding = self.data, None
+        if isinstance(data, BytesIO):
+            data = data.getvalue()
+        if isinstance(data, bytes):
+            data, data_encoding = b64encode(data).decode("ascii"), "base64"
         return (
             f"{self.__class__.__module__}.{self.__class__.__name__}",
             {
@@ -167,7 +208,8 @@ class MSGraphTrigger(BaseTrigger):
                 "method": self.method,
                 "query_parameters": self.query_parameters,
                 "headers": self.headers,
-                "data": self.data,
+                "data": data,
+                "data_encoding": data_encoding,
                 "response_type": self.response_type,
             },
         )
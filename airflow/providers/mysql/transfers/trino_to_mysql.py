@@ -17,7 +17,17 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, suppress
+from datetime import date, datetime, time
+from decimal import Decimal
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Iterator, Sequence
+from uuid import UUID
+
+from more_itertools import chunked
 
 from airflow.models import BaseOperator
 from airflow.providers.mysql.hooks.mysql import MySqlHook
@@ -26,13 +36,17 @@ from airflow.providers.trino.hooks.trino import TrinoHook
 if TYPE_CHECKING:
     from airflow.utils.context import Context
 
+# Types whose str() is a value MySQL reads back correctly from a LOAD DATA file.
+_INFILE_TEXT_TYPES = (str, int, float, Decimal, date, datetime, time, UUID)
+
 
 class TrinoToMySqlOperator(BaseOperator):
     """
     Moves data from Trino to MySQL.
 
-    Note that for now the data is loaded into memory before being pushed
-    to MySQL, so this operator should be used for smallish amount of data.
+    Rows are fetched from Trino in chunks of ``chunk_size`` by a background
+    thread while the previous chunks are written to MySQL. At most a few chunks
+    are buffered, so the whole result set is never held in memory at once.
 
     :param sql: SQL query to execute against Trino. (templated)
     :param mysql_table: target MySQL table, use dot notation to target a
@@ -43,6 +57,13 @@ class TrinoToMySqlOperator(BaseOperator):
         import, typically use to truncate of delete in place
         of the data coming in, allowing the task to be idempotent (running
         the task twice won't double load data). (templated)
+    :param chunk_size: number of rows fetched from Trino at a time, which is also
+        the number of rows inserted into MySQL per transaction. Must be positive (default 1000).
+    :param bulk_load: flag to use bulk_load option. This spools the rows to a
+        tab-delimited local file and loads it with the LOAD DATA LOCAL INFILE command
+        instead of running INSERT statements. The MySQL server must support loading
+        local files via this command (it is disabled by default). Trino ``array``, ``map``
+        and ``row`` values cannot be written to the file and fail the task.
     """
 
     template_fields: Sequence[str] = ("sql", "mysql_table", "mysql_preoperator")
@@ -61,25 +82,131 @@ class TrinoToMySqlOperator(BaseOperator):
         trino_conn_id: str = "trino_default",
         mysql_conn_id: str = "mysql_default",
         mysql_preoperator: str | None = None,
+        chunk_size: int = 1000,
+        bulk_load: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
         self.sql = sql
         self.mysql_table = mysql_table
         self.mysql_conn_id = mysql_conn_id
         self.mysql_preoperator = mysql_preoperator
         self.trino_conn_id = trino_conn_id
+        self.chunk_size = chunk_size
+        self.bulk_load = bulk_load
 
     def execute(self, context: Context) -> None:
         trino = TrinoHook(trino_conn_id=self.trino_conn_id)
-        self.log.info("Extracting data from Trino: %s", self.sql)
-        results = trino.get_records(self.sql)
+        mysql = MySqlHook(mysql_conn_id=self.mysql_conn_id, local_infile=self.bulk_load)
+
+        with closing(trino.get_conn()) as conn, closing(conn.cursor()) as cursor:
+            self.log.info("Extracting data from Trino: %s", self.sql)
+            cursor.execute(self.sql)
+
+            if self.bulk_load:
+                self._bulk_load_transfer(mysql, cursor)
+            else:
+                self._run_preoperator(mysql)
+                self.log.info("Inserting rows into MySQL")
+                # Closing the rows stops and joins the fetching thread even if the insert fails,
+                # so it is never left reading from the cursor while the cursor is being closed.
+                with closing(self._fetch_rows(cursor)) as rows:
+                    self._insert_transfer(mysql, rows)
+
+    def _insert_transfer(self, mysql: MySqlHook, rows: Iterator[tuple]) -> None:
+        # All rows come from one query, so they share the same columns. Each chunk is passed to
+        # cursor.executemany, which the MySQL drivers send as multi-row INSERT statements.
+        count = 0
+        with closing(mysql.get_conn()) as conn, closing(conn.cursor()) as cursor:
+            mysql.set_autocommit(conn, False)
+            sql = None
+            for chunk in chunked(rows, self.chunk_size):
+                if sql is None:
+                    placeholders = ",".join([mysql.placeholder] * len(chunk[0]))
+                    sql = f"INSERT INTO {self.mysql_table} VALUES ({placeholders})"
+                cursor.executemany(sql, chunk)
+                conn.commit()
+                count += len(chunk)
+                self.log.info("Loaded %s rows into %s so far", count, self.mysql_table)
+        self.log.info("Done loading. Loaded a total of %s rows into %s", count, self.mysql_table)
+
+    def _bulk_load_transfer(self, mysql: MySqlHook, cursor) -> None:
+        with NamedTemporaryFile("wb") as tmpfile:
+            self.log.info("Writing rows from Trino to local file %s", tmpfile.name)
+            count = 0
+            with closing(self._fetch_rows(cursor)) as rows:
+                for row in rows:
+                    tmpfile.write(b"\t".join(map(self._to_infile_field, row)))
+                    tmpfile.write(b"\n")
+                    count += 1
+            tmpfile.flush()
+
+            self._run_preoperator(mysql)
+            self.log.info("Bulk loading %s rows into MySQL", count)
+            mysql.bulk_load(table=self.mysql_table, tmp_file=tmpfile.name)
 
-        mysql = MySqlHook(mysql_conn_id=self.mysql_conn_id)
+    def _run_preoperator(self, mysql: MySqlHook) -> None:
         if self.mysql_preoperator:
             self.log.info("Running MySQL preoperator")
             self.log.info(self.mysql_preoperator)
             mysql.run(self.mysql_preoperator)
 
-        self.log.info("Inserting rows into MySQL")
-        mysql.insert_rows(table=self.mysql_table, rows=results)
+    def _fetch_rows(self, cursor) -> Iterator[tuple]:
+        chunks: queue.Queue[list | None] = queue.Queue(maxsize=4)
+        done = threading.Event()
+
+        def put(chunk: list | None) -> None:
+            while not done.is_set():
+                with suppress(queue.Full):
+                    chunks.put(chunk, timeout=1)
+                    return
+
+        def produce() -> None:
+            try:
+                while not done.is_set():
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        return
+                    put(rows)
+            finally:
+                put(None)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="trino-fetch") as executor:
+            future = executor.submit(produce)
+            try:
+                while (rows := chunks.get()) is not None:
+                    yield from rows
+            finally:
+                # Unblock the producer if the consumer stopped early.
+                done.set()
+                with suppress(queue.Empty):
+                    while True:
+                        chunks.get_nowait()
+            future.result()
+
+    @staticmethod
+    def _to_infile_field(value: object) -> bytes:
+        """
+        Render a value using the default escaping rules of LOAD DATA INFILE.
+
+        Text is written as UTF-8 and ``bytes`` (Trino ``varbinary``) are written as-is, both
+        escaped so that they are loaded back byte for byte.
+
+        :raises ValueError: for values that have no faithful representation in the file,
+            such as Trino ``array``, ``map`` and ``row`` values.
+        """
+        if value is None:
+            return b"\\N"
+        if isinstance(value, bool):
+            return b"1" if value else b"0"
+        if not isinstance(value, (bytes, *_INFILE_TEXT_TYPES)):
+            raise ValueError(  # noqa: TRY004
+                f"Cannot write a value of type {type(value).__name__} to a LOAD DATA file, "
+                "use bulk_load=False or cast it to a scalar type in the Trino query."
+            )
+        data = value if isinstance(value, bytes) else str(value).encode("utf-8")
+        return (
+            data.replace(b"\\", b"\\\\").replace(b"\t", b"\\t").replace(b"\n", b"\\n").replace(b"\0", b"\\0")
+        )
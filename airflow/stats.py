@@ -21,6 +21,7 @@ import logging
 import socket
 from typing import TYPE_CHECKING, Callable
 
+from airflow.compat.functools import cache
 from airflow.configuration import conf
 from airflow.metrics.base_stats_logger import NoStatsLogger
 
@@ -29,6 +30,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Logger methods that are bound directly on Stats once the logger exists.
+_BOUND_METHODS = frozenset(("incr", "decr", "gauge", "timing", "timer", "pipeline"))
+
 
 class _Stats(type):
     factory: Callable
@@ -41,7 +45,18 @@ class _Stats(type):
             except (socket.gaierror, ImportError) as e:
                 log.error("Could not configure StatsClient: %s, using NoStatsLogger instead.", e)
                 cls.instance = NoStatsLogger()
-        return getattr(cls.instance, name)
+        attr = getattr(cls.instance, name)
+        if name in _BOUND_METHODS:
+            # Later lookups of this method find it on the class and skip __getattr__.
+            type.__setattr__(cls, name, attr)
+        return attr
+
+    def __setattr__(cls, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name == "instance":
+            # Drop the methods bound from the previous logger.
+            for method in _BOUND_METHODS & cls.__dict__.keys():
+                type.__delattr__(cls, method)
 
     def __init__(cls, *args, **kwargs) -> None:
         super().__init__(cls)
@@ -65,10 +80,15 @@ class _Stats(type):
     @classmethod
     def get_constant_tags(cls) -> list[str]:
         """Get constant DataDog tags to add to all stats."""
-        tags_in_string = conf.get("metrics", "statsd_datadog_tags", fallback=None)
-        if not tags_in_string:
-            return []
-        return tags_in_string.split(",")
+        return list(_get_constant_tags())
+
+
+@cache
+def _get_constant_tags() -> tuple[str, ...]:
+    tags_in_string = conf.get("metrics", "statsd_datadog_tags", fallback=None)
+    if not tags_in_string:
+        return ()
+    return tuple(tags_in_string.split(","))
 
 
 if TYPE_CHECKING:
@@ -22,7 +22,7 @@ import collections.abc
 import logging
 import sys
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -74,6 +74,9 @@ DEFAULT_SENSITIVE_FIELDS = frozenset(
 
 SECRETS_TO_SKIP_MASKING_FOR_TESTS = {"airflow"}
 
+# Values of these types can never contain a secret, so they are returned as-is by the redactor
+_LEAF_TYPES = frozenset({int, float, bool, bytes, type(None)})
+
 
 @cache
 def get_sensitive_variables_fields():
@@ -96,11 +99,22 @@ def should_hide_value_for_key(name):
     from airflow import settings
 
     if isinstance(name, str) and settings.HIDE_SENSITIVE_VAR_CONN_FIELDS:
-        name = name.strip().lower()
-        return any(s in name for s in get_sensitive_variables_fields())
+        return _is_sensitive_name(name, get_sensitive_variables_fields())
     return False
 
 
+@cache
+def _sensitive_fields_pattern(sensitive_fields: frozenset[str]) -> Pattern:
+    return re2.compile("|".join(re2.escape(field) for field in sensitive_fields))
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_name(name: str, sensitive_fields: frozenset[str]) -> bool:
+    # The same few connection extra and variable names are checked over and over, and the
+    # sensitive fields are part of the key so the cache follows changes to the config.
+    return _sensitive_fields_pattern(sensitive_fields).search(name.strip().lower()) is not None
+
+
 def mask_secret(secret: str | dict | Iterable, name: str | None = None) -> None:
     """
     Mask a secret from appearing in the task logs.
@@ -124,6 +138,13 @@ def redact(value: Redactable, name: str | None = None, max_depth: int | None = N
     return _secrets_masker().redact(value, name, max_depth)
 
 
+@lru_cache(maxsize=256)
+def _escape(secret: str) -> str:
+    # The same connections and variables get masked again every time they are fetched, and escaping
+    # long secrets character by character is not free. Bounded, so old secrets are not kept forever.
+    return re2.escape(secret)
+
+
 @cache
 def _secrets_masker() -> SecretsMasker:
     for flt in logging.getLogger("airflow.task").filters:
@@ -150,6 +171,29 @@ def _is_v1_env_var(v: Any) -> TypeGuard[V1EnvVar]:
     return isinstance(v, _get_v1_env_var_type())
 
 
+@cache
+def _get_record_attrs_to_ignore() -> frozenset[str]:
+    # Doing log.info(..., extra={'foo': 2}) sets extra properties on
+    # record, i.e. record.foo. And we need to filter those too. Fun
+    #
+    # Create a record, and look at what attributes are on it, and ignore
+    # all the default ones! The result is the same for every masker, so
+    # it is only computed once per process.
+
+    record = logging.getLogRecordFactory()(
+        # name, level, pathname, lineno, msg, args, exc_info, func=None, sinfo=None,
+        "x",
+        logging.INFO,
+        __file__,
+        1,
+        "",
+        (),
+        exc_info=None,
+        func="funcname",
+    )
+    return frozenset(record.__dict__).difference({"msg", "args"})
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
@@ -163,26 +207,9 @@ class SecretsMasker(logging.Filter):
         super().__init__()
         self.patterns = set()
 
-    @cached_property
+    @property
     def _record_attrs_to_ignore(self) -> Iterable[str]:
-        # Doing log.info(..., extra={'foo': 2}) sets extra properties on
-        # record, i.e. record.foo. And we need to filter those too. Fun
-        #
-        # Create a record, and look at what attributes are on it, and ignore
-        # all the default ones!
-
-        record = logging.getLogRecordFactory()(
-            # name, level, pathname, lineno, msg, args, exc_info, func=None, sinfo=None,
-            "x",
-            logging.INFO,
-            __file__,
-            1,
-            "",
-            (),
-            exc_info=None,
-            func="funcname",
-        )
-        return frozenset(record.__dict__).difference({"msg", "args"})
+        return _get_record_attrs_to_ignore()
 
     def _redact_exception_with_context(self, exception):
         # Exception class may not be modifiable (e.g. declared by an
@@ -205,13 +232,18 @@ class SecretsMasker(logging.Filter):
             # "private" flag that stops us needing to process it more than once
             return True
 
-        if self.replacer:
-            for k, v in record.__dict__.items():
-                if k not in self._record_attrs_to_ignore:
-                    record.__dict__[k] = self.redact(v)
-            if record.exc_info and record.exc_info[1] is not None:
-                exc = record.exc_info[1]
-                self._redact_exception_with_context(exc)
+        if self.replacer is None:
+            # Nothing has been registered to mask yet, so there is nothing to walk
+            record.__dict__[self.ALREADY_FILTERED_FLAG] = True
+            return True
+
+        attrs_to_ignore = self._record_attrs_to_ignore
+        for k, v in record.__dict__.items():
+            if k not in attrs_to_ignore:
+                record.__dict__[k] = self.redact(v)
+        if record.exc_info and record.exc_info[1] is not None:
+            exc = record.exc_info[1]
+            self._redact_exception_with_context(exc)
         record.__dict__[self.ALREADY_FILTERED_FLAG] = True
 
         return True
@@ -237,7 +269,7 @@ class SecretsMasker(logging.Filter):
         # Avoid spending too much effort on redacting on deeply nested
         # structures. This also avoid infinite recursion if a structure has
         # reference to self.
-        if depth > max_depth:
+        if depth > max_depth or type(item) in _LEAF_TYPES:
             return item
         try:
             if name and should_hide_value_for_key(name):
@@ -333,27 +365,38 @@ class SecretsMasker(logging.Filter):
 
     def add_mask(self, secret: str | dict | Iterable, name: str | None = None):
         """Add a new secret to be masked to this filter instance."""
+        new_patterns: set[str] = set()
+        self._collect_patterns(secret, name, new_patterns)
+        new_patterns -= self.patterns
+        if new_patterns:
+            # Compile once for the whole secret rather than once per nested value
+            self.patterns |= new_patterns
+            # Longest first, so that a secret is never partially masked by one of its prefixes,
+            # and sorted so the alternation does not depend on set iteration order.
+            self.replacer = re2.compile("|".join(sorted(self.patterns, key=lambda p: (-len(p), p))))
+
+    def _collect_patterns(self, secret: str | dict | Iterable, name: str | None, out: set[str]) -> None:
         if isinstance(secret, dict):
             for k, v in secret.items():
-                self.add_mask(v, k)
+                self._collect_patterns(v, k, out)
         elif isinstance(secret, str):
             if not secret or (self._test_mode and secret in SECRETS_TO_SKIP_MASKING_FOR_TESTS):
                 return
+            if name and not should_hide_value_for_key(name):
+                return
+
+            if self._mask_adapter is None:
+                # The common case: no adapter configured, so the secret is the only thing to mask
+                out.add(_escape(secret))
+                return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
-                    pattern = re2.escape(s)
-                    if pattern not in self.patterns and (not name or should_hide_value_for_key(name)):
-                        self.patterns.add(pattern)
-                        new_mask = True
-
-            if new_mask:
-                self.replacer = re2.compile("|".join(self.patterns))
+                    out.add(_escape(s))
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
-                self.add_mask(v, name)
+                self._collect_patterns(v, name, out)
 
 
 class RedactedIO(TextIO):
@@ -0,0 +1,184 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.cloud.hooks.cloud_build import CloudBuildAsyncHook, CloudBuildHook
+from airflow.providers.google.common.hooks.base_google import GoogleBaseHook
+
+CLOUD_BUILD_PATH = "airflow.providers.google.cloud.hooks.cloud_build"
+BUILD = {"id": "test-build-id-9832662"}
+PROJECT_ID = "cloud-build-project"
+
+
+def _operation(build):
+    operation = mock.MagicMock()
+    operation.metadata.build = build
+    return operation
+
+
+class TestCloudBuildHook:
+    def setup_method(self):
+        with mock.patch.object(GoogleBaseHook, "__init__", return_value=None):
+            self.hook = CloudBuildHook()
+
+    @mock.patch.object(CloudBuildHook, "wait_for_operation")
+    @mock.patch.object(CloudBuildHook, "create_build_without_waiting_for_result")
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_create_builds(self, mock_get_conn, mock_create, mock_wait):
+        mock_create.side_effect = lambda build, **kwargs: (_operation(build), build.id)
+        mock_wait.side_effect = lambda operation, timeout: operation.metadata.build.id
+
+        result = self.hook.create_builds(
+            builds=[{"id": "build-1"}, {"id": "build-2"}, {"id": "build-3"}],
+            project_id=PROJECT_ID,
+            timeout=5,
+            location="europe-west1",
+        )
+
+        assert result == ["build-1", "build-2", "build-3"]
+        mock_get_conn.assert_called_once_with(location="europe-west1")
+        assert mock_create.call_count == 3
+        for call in mock_create.call_args_list:
+            assert call.kwargs["project_id"] == PROJECT_ID
+            assert call.kwargs["location"] == "europe-west1"
+        assert all(call.args[1] == 5 for call in mock_wait.call_args_list)
+
+    @mock.patch.object(CloudBuildHook, "wait_for_operation")
+    @mock.patch.object(CloudBuildHook, "create_build_without_waiting_for_result")
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_create_builds_without_wait(self, mock_get_conn, mock_create, mock_wait):
+        mock_create.side_effect = lambda build, **kwargs: (_operation(build), build.id)
+
+        result = self.hook.create_builds(builds=[{"id": "build-1"}, BUILD], project_id=PROJECT_ID, wait=False)
+
+        assert [build.id for build in result] == ["build-1", BUILD["id"]]
+        mock_wait.assert_not_called()
+
+    @mock.patch.object(CloudBuildHook, "create_build_without_waiting_for_result")
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_create_builds_empty(self, mock_get_conn, mock_create):
+        assert self.hook.create_builds(builds=[], project_id=PROJECT_ID) == []
+        mock_get_conn.assert_not_called()
+        mock_create.assert_not_called()
+
+    @mock.patch.object(CloudBuildHook, "wait_for_operation")
+    @mock.patch.object(CloudBuildHook, "create_build_without_waiting_for_result")
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_create_builds_submission_error(self, mock_get_conn, mock_create, mock_wait):
+        def create(build, **kwargs):
+            if build.id == "build-2":
+                raise AirflowException("quota exceeded")
+            return _operation(build), build.id
+
+        mock_create.side_effect = create
+
+        with pytest.raises(AirflowException, match="quota exceeded"):
+            self.hook.create_builds(
+                builds=[{"id": "build-1"}, {"id": "build-2"}, {"id": "build-3"}], project_id=PROJECT_ID
+            )
+
+        # The other builds are submitted anyway and left running.
+        assert sorted(call.kwargs["build"].id for call in mock_create.call_args_list) == [
+            "build-1",
+            "build-2",
+            "build-3",
+        ]
+        mock_wait.assert_not_called()
+        mock_get_conn.return_value.cancel_build.assert_not_called()
+
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_list_build_triggers_stream(self, mock_get_conn):
+        pages = [mock.MagicMock(triggers=["trigger-1", "trigger-2"]), mock.MagicMock(triggers=["trigger-3"])]
+        mock_client = mock_get_conn.return_value
+        mock_client.list_build_triggers.return_value.pages = pages
+
+        result = list(
+            self.hook.list_build_triggers_stream(location="europe-west1", project_id=PROJECT_ID, page_size=2)
+        )
+
+        assert result == ["trigger-1", "trigger-2", "trigger-3"]
+        mock_get_conn.assert_called_once_with(location="europe-west1")
+        mock_client.list_build_triggers.assert_called_once_with(
+            request={
+                "parent": f"projects/{PROJECT_ID}/locations/europe-west1",
+                "project_id": PROJECT_ID,
+                "page_size": 2,
+            },
+            retry=mock.ANY,
+            timeout=None,
+            metadata=(),
+        )
+
+    @mock.patch.object(CloudBuildHook, "get_conn")
+    def test_list_build_triggers_stream_page_error(self, mock_get_conn):
+        def pages():
+            yield mock.MagicMock(triggers=["trigger-1"])
+            raise AirflowException("page request failed")
+
+        mock_get_conn.return_value.list_build_triggers.return_value.pages = pages()
+
+        stream = self.hook.list_build_triggers_stream(project_id=PROJECT_ID)
+
+        assert next(stream) == "trigger-1"
+        with pytest.raises(AirflowException, match="page request failed"):
+            next(stream)
+
+
+class TestAsyncHook:
+    def setup_method(self):
+        with mock.patch.object(GoogleBaseHook, "__init__", return_value=None):
+            self.hook = CloudBuildAsyncHook()
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{CLOUD_BUILD_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    async def test_wait_for_operation_backs_off_without_deadline(self, mock_sleep):
+        operation = mock.MagicMock()
+        operation.done = mock.AsyncMock(side_effect=[False] * 6 + [True])
+        operation.result = mock.AsyncMock(return_value=BUILD)
+
+        result = await self.hook._wait_for_operation(operation)
+
+        assert result == BUILD
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{CLOUD_BUILD_PATH}.time.monotonic")
+    @mock.patch(f"{CLOUD_BUILD_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    async def test_wait_for_operation_timeout(self, mock_sleep, mock_monotonic):
+        mock_monotonic.side_effect = [0.0, 0.0, 1.0, 3.0]
+        operation = mock.MagicMock()
+        operation.done = mock.AsyncMock(return_value=False)
+
+        with pytest.raises(AirflowException, match="did not complete within 3 seconds"):
+            await self.hook._wait_for_operation(operation, timeout=3)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_operation_error(self):
+        operation = mock.MagicMock()
+        operation.done = mock.AsyncMock(return_value=True)
+        operation.result = mock.AsyncMock(side_effect=Exception("failed"))
+        operation.exception = mock.AsyncMock(return_value="build failed")
+
+        with pytest.raises(AirflowException, match="build failed"):
+            await self.hook._wait_for_operation(operation)
@@ -0,0 +1,89 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.cloud.hooks.looker import JobStatus, LookerHook
+
+HOOK_PATH = "airflow.providers.google.cloud.hooks.looker"
+JOB_ID = "test-id"
+CONN_ID = "test-conn"
+
+
+class TestLookerHook:
+    def setup_method(self):
+        self.hook = LookerHook(looker_conn_id=CONN_ID)
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{HOOK_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch.object(LookerHook, "pdt_build_status")
+    async def test_async_wait_for_job(self, mock_pdt_build_status, mock_sleep):
+        mock_pdt_build_status.side_effect = [
+            {"status": JobStatus.QUEUED.value},
+            {"status": JobStatus.RUNNING.value},
+            {"status": JobStatus.DONE.value},
+        ]
+
+        await self.hook.async_wait_for_job(materialization_id=JOB_ID, wait_time=10)
+
+        assert mock_pdt_build_status.call_count == 3
+        mock_pdt_build_status.assert_called_with(materialization_id=JOB_ID)
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{HOOK_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch.object(LookerHook, "pdt_build_status")
+    async def test_async_wait_for_job_already_done(self, mock_pdt_build_status, mock_sleep):
+        mock_pdt_build_status.return_value = {"status": JobStatus.DONE.value}
+
+        await self.hook.async_wait_for_job(materialization_id=JOB_ID)
+
+        mock_pdt_build_status.assert_called_once_with(materialization_id=JOB_ID)
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{HOOK_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch.object(LookerHook, "pdt_build_status")
+    async def test_async_wait_for_job_error(self, mock_pdt_build_status, mock_sleep):
+        mock_pdt_build_status.side_effect = [
+            {"status": JobStatus.RUNNING.value},
+            {"status": JobStatus.ERROR.value, "message": "PDT build failed"},
+        ]
+
+        with pytest.raises(AirflowException, match="PDT build failed"):
+            await self.hook.async_wait_for_job(materialization_id=JOB_ID)
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{HOOK_PATH}.time.monotonic")
+    @mock.patch(f"{HOOK_PATH}.asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch.object(LookerHook, "stop_pdt_build")
+    @mock.patch.object(LookerHook, "pdt_build_status")
+    async def test_async_wait_for_job_timeout(
+        self, mock_pdt_build_status, mock_stop_pdt_build, mock_sleep, mock_monotonic
+    ):
+        mock_pdt_build_status.return_value = {"status": JobStatus.RUNNING.value}
+        mock_monotonic.side_effect = [0.0, 1.0, 1.0, 31.0]
+
+        with pytest.raises(AirflowException, match="Timeout"):
+            await self.hook.async_wait_for_job(materialization_id=JOB_ID, wait_time=10, timeout=30)
+
+        mock_stop_pdt_build.assert_called_once_with(materialization_id=JOB_ID)
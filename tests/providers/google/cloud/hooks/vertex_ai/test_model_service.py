@@ -0,0 +1,143 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.providers.google.cloud.hooks.vertex_ai.model_service import ModelServiceAsyncHook
+
+MODEL_SERVICE_PATH = "airflow.providers.google.cloud.hooks.vertex_ai.model_service"
+PROJECT_ID = "test-project-id"
+REGION = "us-central1"
+
+
+async def _pager(items):
+    for item in items:
+        yield item
+
+
+class TestModelServiceAsyncHook:
+    def setup_method(self):
+        self.hook = ModelServiceAsyncHook()
+        self.client = mock.MagicMock()
+        self.hook.get_model_service_client = mock.AsyncMock(return_value=self.client)
+
+    @pytest.mark.asyncio
+    @mock.patch(f"{MODEL_SERVICE_PATH}.ModelServiceAsyncClient")
+    async def test_get_model_service_client_is_shared_per_region(self, mock_client):
+        hook = ModelServiceAsyncHook()
+        sync_hook = mock.MagicMock()
+        hook.get_sync_hook = mock.AsyncMock(return_value=sync_hook)
+        mock_client.side_effect = lambda **kwargs: mock.MagicMock()
+
+        regional = await hook.get_model_service_client(REGION)
+        assert await hook.get_model_service_client(REGION) is regional
+        assert await hook.get_model_service_client() is not regional
+
+        assert mock_client.call_count == 2
+        assert sync_hook.get_credentials.call_count == 2
+        endpoints = [call.kwargs["client_options"].api_endpoint for call in mock_client.call_args_list]
+        assert endpoints == [f"{REGION}-aiplatform.googleapis.com:443", None]
+
+    @pytest.mark.asyncio
+    async def test_list_models(self):
+        self.client.list_models = mock.AsyncMock(return_value=_pager(["model-1", "model-2", "model-3"]))
+
+        result = await self.hook.list_models(
+            project_id=PROJECT_ID, region=REGION, filter="labels.team=ml", page_size=2
+        )
+
+        assert result == ["model-1", "model-2", "model-3"]
+        self.hook.get_model_service_client.assert_awaited_once_with(REGION)
+        self.client.list_models.assert_awaited_once_with(
+            request={
+                "parent": f"projects/{PROJECT_ID}/locations/{REGION}",
+                "filter": "labels.team=ml",
+                "page_size": 2,
+                "read_mask": None,
+                "order_by": None,
+            },
+            retry=mock.ANY,
+            timeout=None,
+            metadata=(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_models_empty(self):
+        self.client.list_models = mock.AsyncMock(return_value=_pager([]))
+
+        assert await self.hook.list_models(project_id=PROJECT_ID, region=REGION) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_models(self):
+        self.client.delete_model = mock.AsyncMock(side_effect=lambda request, **kwargs: request["name"])
+
+        result = await self.hook.delete_models(
+            project_id=PROJECT_ID, region=REGION, models=["model-1", "model-2"], timeout=30
+        )
+
+        assert result == [
+            f"projects/{PROJECT_ID}/locations/{REGION}/models/model-1",
+            f"projects/{PROJECT_ID}/locations/{REGION}/models/model-2",
+        ]
+        self.hook.get_model_service_client.assert_awaited_once_with(REGION)
+        assert self.client.delete_model.await_count == 2
+        assert all(call.kwargs["timeout"] == 30 for call in self.client.delete_model.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_delete_models_error(self):
+        self.client.delete_model = mock.AsyncMock(side_effect=[mock.MagicMock(), ValueError("not found")])
+
+        with pytest.raises(ValueError, match="not found"):
+            await self.hook.delete_models(project_id=PROJECT_ID, region=REGION, models=["model-1", "model-2"])
+
+    @pytest.mark.asyncio
+    async def test_export_models(self):
+        output_config = {
+            "export_format_id": "tf-saved-model",
+            "artifact_destination": {"output_uri_prefix": "gs://b"},
+        }
+        self.client.export_model = mock.AsyncMock(side_effect=lambda request, **kwargs: request)
+
+        result = await self.hook.export_models(
+            project_id=PROJECT_ID, region=REGION, models=["model-1", "model-2"], output_config=output_config
+        )
+
+        assert result == [
+            {
+                "name": f"projects/{PROJECT_ID}/locations/{REGION}/models/model-1",
+                "output_config": output_config,
+            },
+            {
+                "name": f"projects/{PROJECT_ID}/locations/{REGION}/models/model-2",
+                "output_config": output_config,
+            },
+        ]
+        self.hook.get_model_service_client.assert_awaited_once_with(REGION)
+
+    @pytest.mark.asyncio
+    async def test_export_models_empty(self):
+        self.client.export_model = mock.AsyncMock()
+
+        assert (
+            await self.hook.export_models(project_id=PROJECT_ID, region=REGION, models=[], output_config={})
+            == []
+        )
+        self.client.export_model.assert_not_awaited()
@@ -0,0 +1,95 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException, TaskDeferred
+from airflow.providers.google.cloud.operators.looker import LookerStartPdtBuildOperator
+from airflow.providers.google.cloud.triggers.looker import LookerCheckPdtBuildTrigger
+
+OPERATOR_PATH = "airflow.providers.google.cloud.operators.looker"
+TASK_ID = "task-id"
+JOB_ID = "test-id"
+CONN_ID = "test-conn"
+MODEL = "test_model"
+VIEW = "test_view"
+
+
+class TestLookerStartPdtBuildOperator:
+    def setup_method(self):
+        self.kwargs = {
+            "task_id": TASK_ID,
+            "looker_conn_id": CONN_ID,
+            "model": MODEL,
+            "view": VIEW,
+        }
+
+    @mock.patch(f"{OPERATOR_PATH}.LookerHook")
+    def test_execute(self, mock_hook):
+        mock_hook.return_value.start_pdt_build.return_value.materialization_id = JOB_ID
+
+        result = LookerStartPdtBuildOperator(**self.kwargs).execute(context={})
+
+        mock_hook.return_value.wait_for_job.assert_called_once_with(
+            materialization_id=JOB_ID, wait_time=10, timeout=None
+        )
+        assert result == JOB_ID
+
+    @mock.patch(f"{OPERATOR_PATH}.LookerHook")
+    def test_execute_deferrable(self, mock_hook):
+        mock_hook.return_value.start_pdt_build.return_value.materialization_id = JOB_ID
+        operator = LookerStartPdtBuildOperator(deferrable=True, wait_time=5, wait_timeout=60, **self.kwargs)
+
+        with pytest.raises(TaskDeferred) as exc:
+            operator.execute(context={})
+
+        mock_hook.return_value.wait_for_job.assert_not_called()
+        trigger = exc.value.trigger
+        assert isinstance(trigger, LookerCheckPdtBuildTrigger)
+        assert trigger.materialization_id == JOB_ID
+        assert trigger.wait_time == 5
+        assert trigger.timeout == 60
+        assert exc.value.method_name == "execute_complete"
+
+    @mock.patch(f"{OPERATOR_PATH}.LookerHook")
+    def test_execute_deferrable_asynchronous(self, mock_hook):
+        mock_hook.return_value.start_pdt_build.return_value.materialization_id = JOB_ID
+        operator = LookerStartPdtBuildOperator(deferrable=True, asynchronous=True, **self.kwargs)
+
+        assert operator.execute(context={}) == JOB_ID
+        mock_hook.return_value.wait_for_job.assert_not_called()
+
+    def test_execute_complete(self):
+        operator = LookerStartPdtBuildOperator(**self.kwargs)
+        event = {
+            "status": "success",
+            "materialization_id": JOB_ID,
+            "message": "PDT materialization job completed",
+        }
+
+        assert operator.execute_complete(context={}, event=event) == JOB_ID
+
+    def test_execute_complete_error(self):
+        operator = LookerStartPdtBuildOperator(**self.kwargs)
+        event = {"status": "error", "materialization_id": JOB_ID, "message": "PDT materialization job failed"}
+
+        with pytest.raises(AirflowException, match="PDT materialization job failed"):
+            operator.execute_complete(context={}, event=event)
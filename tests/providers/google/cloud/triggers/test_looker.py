@@ -0,0 +1,85 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.cloud.triggers.looker import LookerCheckPdtBuildTrigger
+from airflow.triggers.base import TriggerEvent
+
+HOOK_PATH = "airflow.providers.google.cloud.triggers.looker.LookerHook"
+JOB_ID = "test-id"
+CONN_ID = "test-conn"
+
+
+@pytest.fixture
+def trigger():
+    return LookerCheckPdtBuildTrigger(
+        looker_conn_id=CONN_ID,
+        materialization_id=JOB_ID,
+        wait_time=5,
+        timeout=60,
+    )
+
+
+class TestLookerCheckPdtBuildTrigger:
+    def test_serialize(self, trigger):
+        classpath, kwargs = trigger.serialize()
+
+        assert classpath == "airflow.providers.google.cloud.triggers.looker.LookerCheckPdtBuildTrigger"
+        assert kwargs == {
+            "looker_conn_id": CONN_ID,
+            "materialization_id": JOB_ID,
+            "wait_time": 5,
+            "timeout": 60,
+        }
+
+    @pytest.mark.asyncio
+    @mock.patch(HOOK_PATH)
+    async def test_run_success(self, mock_hook, trigger):
+        mock_hook.return_value.async_wait_for_job = mock.AsyncMock(return_value=None)
+
+        event = await trigger.run().asend(None)
+
+        mock_hook.assert_called_once_with(looker_conn_id=CONN_ID)
+        mock_hook.return_value.async_wait_for_job.assert_awaited_once_with(
+            materialization_id=JOB_ID, wait_time=5, timeout=60
+        )
+        assert event == TriggerEvent(
+            {
+                "status": "success",
+                "materialization_id": JOB_ID,
+                "message": "PDT materialization job completed",
+            }
+        )
+
+    @pytest.mark.asyncio
+    @mock.patch(HOOK_PATH)
+    async def test_run_error(self, mock_hook, trigger):
+        mock_hook.return_value.async_wait_for_job = mock.AsyncMock(
+            side_effect=AirflowException("PDT materialization job failed")
+        )
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {"status": "error", "materialization_id": JOB_ID, "message": "PDT materialization job failed"}
+        )
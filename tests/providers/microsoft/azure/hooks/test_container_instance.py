@@ -0,0 +1,52 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from airflow.providers.microsoft.azure.hooks.container_instance import AzureContainerInstanceHook
+
+
+def _not_found(code: str) -> ResourceNotFoundError:
+    error = ResourceNotFoundError(message=f"{code} error")
+    error.error = mock.Mock(code=code)
+    return error
+
+
+class TestAzureContainerInstanceHook:
+    def setup_method(self):
+        self.hook = AzureContainerInstanceHook(azure_conn_id="azure_container_instance_test")
+        self.hook.connection = mock.MagicMock()
+
+    def test_exists(self):
+        assert self.hook.exists("resource_group", "test")
+        self.hook.connection.container_groups.get.assert_called_once_with("resource_group", "test")
+
+    def test_exists_missing_container_group(self):
+        self.hook.connection.container_groups.get.side_effect = _not_found("ResourceNotFound")
+
+        assert not self.hook.exists("resource_group", "test")
+
+    def test_exists_missing_resource_group(self):
+        self.hook.connection.container_groups.get.side_effect = _not_found("ResourceGroupNotFound")
+
+        with pytest.raises(ResourceNotFoundError, match="ResourceGroupNotFound"):
+            self.hook.exists("resource_group", "test")
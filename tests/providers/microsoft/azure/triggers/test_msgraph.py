@@ -0,0 +1,80 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import math
+from unittest import mock
+
+import pytest
+
+from airflow.providers.microsoft.azure.triggers.msgraph import ResponseSerializer
+
+TRIGGER_MODULE = "airflow.providers.microsoft.azure.triggers.msgraph"
+
+
+class TestResponseSerializer:
+    @pytest.mark.parametrize("encoding", [None, "latin-1", "cp1252"])
+    def test_serialize_non_ascii_ignores_encoding(self, encoding):
+        response = {"displayName": "Zoë Ünal", "city": "Łódź"}
+
+        actual = ResponseSerializer(encoding=encoding).serialize(response)
+
+        assert json.loads(actual) == response
+
+    def test_serialize_round_trips_like_json(self):
+        response = {"value": [{"id": 1, "name": "日本"}], "count": 1, "nested": {"flag": True}}
+        serializer = ResponseSerializer()
+
+        assert serializer.deserialize(serializer.serialize(response)) == json.loads(json.dumps(response))
+
+    def test_serialize_big_int(self):
+        response = {"size": 2**70}
+
+        actual = ResponseSerializer().serialize(response)
+
+        assert json.loads(actual) == response
+
+    def test_serialize_without_orjson(self):
+        response = {"displayName": "Zoë", "size": 2**70}
+
+        with mock.patch(f"{TRIGGER_MODULE}.orjson", None):
+            actual = ResponseSerializer().serialize(response)
+
+        assert actual == json.dumps(response)
+
+    def test_serialize_unserializable_value(self):
+        with pytest.raises(TypeError):
+            ResponseSerializer().serialize({"value": object()})
+
+    @pytest.mark.parametrize(
+        "response",
+        [{"size": 2**70}, {"size": -(2**64)}, [2**100, 1]],
+    )
+    def test_round_trip_big_int(self, response):
+        serializer = ResponseSerializer()
+
+        actual = serializer.deserialize(serializer.serialize(response))
+
+        # 2**70 == float(2**70), so compare the representation to tell ints from floats.
+        assert repr(actual) == repr(response)
+
+    def test_deserialize_nan(self):
+        actual = ResponseSerializer().deserialize('{"value": NaN}')
+
+        assert math.isnan(actual["value"])
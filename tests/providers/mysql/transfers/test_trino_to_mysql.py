@@ -0,0 +1,115 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.providers.mysql.transfers.trino_to_mysql import TrinoToMySqlOperator
+
+TRINO_TO_MYSQL = "airflow.providers.mysql.transfers.trino_to_mysql"
+
+
+class TestTrinoToMySqlTransfer:
+    def setup_method(self):
+        self.kwargs = {
+            "sql": "sql",
+            "mysql_table": "mysql_table",
+            "task_id": "test_trino_to_mysql_transfer",
+        }
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, b"\\N"),
+            (True, b"1"),
+            (False, b"0"),
+            (42, b"42"),
+            (Decimal("1.50"), b"1.50"),
+            (date(2024, 1, 2), b"2024-01-02"),
+            ("tab\there\nnew\\line", b"tab\\there\\nnew\\\\line"),
+            ("zażółć", "zażółć".encode()),
+            (b"\x00\xff\t\n\\", b"\\0\xff\\t\\n\\\\"),
+        ],
+    )
+    def test_to_infile_field(self, value, expected):
+        assert TrinoToMySqlOperator._to_infile_field(value) == expected
+
+    @pytest.mark.parametrize("value", [[1, 2], {"a": 1}, (1, "a")])
+    def test_to_infile_field_rejects_structured_values(self, value):
+        with pytest.raises(ValueError, match="Cannot write a value of type"):
+            TrinoToMySqlOperator._to_infile_field(value)
+
+    @mock.patch(f"{TRINO_TO_MYSQL}.MySqlHook")
+    @mock.patch(f"{TRINO_TO_MYSQL}.TrinoHook")
+    def test_execute_bulk_load(self, mock_trino_hook, mock_mysql_hook):
+        cursor = mock_trino_hook.return_value.get_conn.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, b"\x00\x01"), (2, None)], []]
+        written = []
+        mock_mysql_hook.return_value.bulk_load.side_effect = lambda table, tmp_file: written.append(
+            Path(tmp_file).read_bytes()
+        )
+
+        TrinoToMySqlOperator(bulk_load=True, **self.kwargs).execute(context={})
+
+        mock_mysql_hook.return_value.bulk_load.assert_called_once_with(table="mysql_table", tmp_file=mock.ANY)
+        assert written == [b"1\t\\0\x01\n2\t\\N\n"]
+
+    @mock.patch(f"{TRINO_TO_MYSQL}.MySqlHook")
+    @mock.patch(f"{TRINO_TO_MYSQL}.TrinoHook")
+    def test_execute_bulk_load_rejects_arrays(self, mock_trino_hook, mock_mysql_hook):
+        cursor = mock_trino_hook.return_value.get_conn.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, [1, 2])], []]
+
+        with pytest.raises(ValueError, match="Cannot write a value of type list"):
+            TrinoToMySqlOperator(bulk_load=True, **self.kwargs).execute(context={})
+        mock_mysql_hook.return_value.bulk_load.assert_not_called()
+
+    @mock.patch(f"{TRINO_TO_MYSQL}.MySqlHook")
+    @mock.patch(f"{TRINO_TO_MYSQL}.TrinoHook")
+    def test_execute_inserts_chunks_with_executemany(self, mock_trino_hook, mock_mysql_hook):
+        cursor = mock_trino_hook.return_value.get_conn.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+        mock_mysql_hook.return_value.placeholder = "%s"
+        mysql_conn = mock_mysql_hook.return_value.get_conn.return_value
+        mysql_cursor = mysql_conn.cursor.return_value
+
+        TrinoToMySqlOperator(chunk_size=2, **self.kwargs).execute(context={})
+
+        sql = "INSERT INTO mysql_table VALUES (%s,%s)"
+        assert mysql_cursor.executemany.call_args_list == [
+            mock.call(sql, [(1, "a"), (2, "b")]),
+            mock.call(sql, [(3, "c")]),
+        ]
+        assert mysql_conn.commit.call_count == 2
+        mysql_cursor.execute.assert_not_called()
+
+    @mock.patch(f"{TRINO_TO_MYSQL}.MySqlHook")
+    @mock.patch(f"{TRINO_TO_MYSQL}.TrinoHook")
+    def test_execute_without_rows(self, mock_trino_hook, mock_mysql_hook):
+        cursor = mock_trino_hook.return_value.get_conn.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = [[]]
+        mysql_cursor = mock_mysql_hook.return_value.get_conn.return_value.cursor.return_value
+
+        TrinoToMySqlOperator(**self.kwargs).execute(context={})
+
+        mysql_cursor.executemany.assert_not_called()